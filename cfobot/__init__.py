@@ -1,5 +1,17 @@
 """CFO Bot package."""
 
-from .cli import main
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["main"]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI pulls in pandas and matplotlib; import it only when requested so
+    # submodules such as ``cfobot.config`` stay cheap to import.
+    if name == "main":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,17 +5,101 @@ from __future__ import annotations
 import json
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import ollama
 import pandas as pd
 
+try:  # Optional faster JSON parser (``pip install cfobot[fast]``)
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from .config import AppConfig
 from .data_loader import FinancialData
 from .processing import BudgetResult, KPIResult
 
 logger = logging.getLogger(__name__)
 
+# Markers the model sometimes emits after the JSON object; generation stops there.
+_STOP_SEQUENCES = ("</json>", "\n\n\n")
+
+
+# Static prompt text lives at module scope and is filled with ``str.format_map``.
+_ANALYSIS_SCHEMA = """{
+    "executive_summary": "A 2-3 sentence executive summary of the financial performance",
+    "key_insights": [
+        "Key insight 1 about financial performance",
+        "Key insight 2 about trends or patterns",
+        "Key insight 3 about budget execution"
+    ],
+    "risk_assessment": "Assessment of financial risks and concerns",
+    "recommendations": [
+        "Specific actionable recommendation 1",
+        "Specific actionable recommendation 2",
+        "Specific actionable recommendation 3"
+    ],
+    "trend_analysis": "Analysis of trends and patterns in the data",
+    "budget_analysis": "Detailed analysis of budget execution performance",
+    "kpi_analysis": "Analysis of key performance indicators and ratios",
+    "enhanced_report": "A professional, board-ready executive summary (2-3 paragraphs) that integrates the insights above, highlights key metrics, and addresses risks and opportunities"
+}"""
+
+_ANALYSIS_PROMPT_TEMPLATE = """
+You are a senior financial analyst and CFO advisor. Analyze the financial data at the end of this message and provide comprehensive insights.
+
+Please provide a detailed analysis in the following JSON format:
+
+{schema}
+
+Focus on:
+1. Financial health and performance
+2. Budget execution efficiency
+3. Risk identification and mitigation
+4. Actionable recommendations for improvement
+5. Trend analysis and forecasting insights
+6. Industry benchmarking where applicable
+
+Provide specific, actionable insights based on the data provided.
+
+{financial_data}
+"""
+
+_BATCH_PROMPT_TEMPLATE = """
+You are a senior financial analyst and CFO advisor. The financial data for {period_count} reporting periods is at the end of this message. Analyze each period on its own and provide comprehensive insights.
+
+Respond with a single JSON object of the form {{"results": [...]}} where "results" holds exactly one analysis per period, in the order the periods are given. Each analysis uses the following JSON format:
+
+{schema}
+
+Focus on:
+1. Financial health and performance
+2. Budget execution efficiency
+3. Risk identification and mitigation
+4. Actionable recommendations for improvement
+5. Trend analysis and forecasting insights
+6. Industry benchmarking where applicable
+
+Provide specific, actionable insights based on the data provided.
+
+{financial_data}
+"""
+
+_FALLBACK_REPORT_TEMPLATE = """
+Executive Summary - {current_month} 2025
+
+{executive_summary}
+
+Key Financial Performance:
+The company's financial performance for {current_month} 2025 shows significant insights that require attention. {budget_analysis}
+
+Strategic Recommendations:
+{recommendation}
+"""
+
 
 @dataclass
 class AIInsights:
@@ -27,54 +111,98 @@ class AIInsights:
     trend_analysis: str
     budget_analysis: str
     kpi_analysis: str
+    enhanced_report: str = ""
 
 
-class FinancialAIAnalyzer:
-    """AI-powered financial analysis using Ollama."""
-    
-    def __init__(self, config: AppConfig, model: str = "llama3.1:8b"):
-        """Initialize the AI analyzer.
-        
-        Args:
-            config: Application configuration
-            model: Ollama model to use for analysis
-        """
-        self.config = config
-        self.model = model
-        self.client = ollama.Client()
-        
-    def _format_financial_data(self, data: FinancialData, budget: BudgetResult, kpis: KPIResult) -> str:
-        """Format financial data for AI analysis.
-        
-        Args:
-            data: Financial data
-            budget: Budget execution results
-            kpis: KPI results
-            
-        Returns:
-            Formatted string with financial data
-        """
-        # Extract key metrics
-        ingresos = float(budget.summary.loc[0, f"Actual {data.current_month}"])
-        gastos = float(budget.summary.loc[1, f"Actual {data.current_month}"])
-        ejecutado_ingresos = float(budget.summary.loc[0, "% Ejecutado"])
-        ejecutado_gastos = float(budget.summary.loc[1, "% Ejecutado"])
-        
-        # KPI metrics
-        current_ratio = kpis.metrics.get("Current Ratio", 0)
-        margen_bruto = kpis.metrics.get("Margen Bruto %", 0)
-        margen_neto = kpis.metrics.get("Margen Neto %", 0)
-        roe = kpis.metrics.get("ROE %", 0)
-        ebitda = kpis.metrics.get("EBITDA", 0)
-        
-        # Expense breakdown
-        gastos_admin = budget.gastos_admin
-        gastos_otros = budget.gastos_otros
-        costos_venta = budget.costos_venta
-        costos_prod = budget.costos_produccion
-        
-        return f"""
-FINANCIAL DATA FOR ANALYSIS - {data.current_month} 2025
+class _JSONObjectScanner:
+    """Incrementally locate the first top-level JSON object in streamed text."""
+
+    def __init__(self) -> None:
+        self._chunks: List[str] = []
+        self._length = 0
+        self._start = -1
+        self._end = -1
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def complete(self) -> bool:
+        return self._end != -1
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    @property
+    def object_text(self) -> Optional[str]:
+        if not self.complete:
+            return None
+        return self.text[self._start:self._end]
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk of text; return True once the object is closed."""
+        offset = self._length
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+        if self.complete:
+            return True
+
+        for index, char in enumerate(chunk):
+            if self._start == -1:
+                if char == "{":
+                    self._start = offset + index
+                    self._depth = 1
+                continue
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._end = offset + index + 1
+                    return True
+        return False
+
+
+@lru_cache(maxsize=None)
+def _get_client(host: str) -> ollama.Client:
+    """Return a long-lived Ollama client per host so its HTTP connection pool is reused."""
+    return ollama.Client(host=host, timeout=60.0)
+
+
+@lru_cache(maxsize=4)
+def _render_financial_data(
+    current_month: str,
+    ingresos: float,
+    gastos: float,
+    ejecutado_ingresos: float,
+    ejecutado_gastos: float,
+    presupuesto_ingresos: float,
+    presupuesto_gastos: float,
+    current_ratio: float,
+    margen_bruto: float,
+    margen_neto: float,
+    roe: float,
+    ebitda: float,
+    gastos_admin: float,
+    gastos_otros: float,
+    costos_venta: float,
+    costos_prod: float,
+    months: tuple[str, ...],
+    current_month_col: str,
+) -> str:
+    """Render the financial data block; memoized on the extracted scalars."""
+    return f"""
+FINANCIAL DATA FOR ANALYSIS - {current_month} 2025
 
 INCOME STATEMENT:
 - Total Revenue: ${ingresos:,.0f} COP
@@ -84,8 +212,8 @@ INCOME STATEMENT:
 BUDGET EXECUTION:
 - Revenue Execution: {ejecutado_ingresos:.1f}% of monthly budget
 - Expense Execution: {ejecutado_gastos:.1f}% of monthly budget
-- Monthly Revenue Budget: ${self.config.budgets.ingresos_mensual:,.0f} COP
-- Monthly Expense Budget: ${self.config.budgets.gastos_mensual:,.0f} COP
+- Monthly Revenue Budget: ${presupuesto_ingresos:,.0f} COP
+- Monthly Expense Budget: ${presupuesto_gastos:,.0f} COP
 
 FINANCIAL RATIOS:
 - Current Ratio: {current_ratio:.2f}
@@ -100,54 +228,99 @@ EXPENSE BREAKDOWN:
 - Production Costs: ${costos_prod:,.0f} COP
 
 MONTHLY TREND DATA:
-Available months: {', '.join(data.months)}
-Current month column: {data.current_month_col}
+Available months: {', '.join(months)}
+Current month column: {current_month_col}
 """
 
+
+def _insights_from_dict(analysis_data: Dict[str, Any]) -> AIInsights:
+    """Build AIInsights from a parsed analysis, filling in missing fields."""
+    return AIInsights(
+        executive_summary=analysis_data.get("executive_summary", "Analysis completed successfully."),
+        key_insights=analysis_data.get("key_insights", ["Analysis completed."]),
+        risk_assessment=analysis_data.get("risk_assessment", "Risk assessment completed."),
+        recommendations=analysis_data.get("recommendations", ["Continue monitoring financial performance."]),
+        trend_analysis=analysis_data.get("trend_analysis", "Trend analysis completed."),
+        budget_analysis=analysis_data.get("budget_analysis", "Budget analysis completed."),
+        kpi_analysis=analysis_data.get("kpi_analysis", "KPI analysis completed."),
+        enhanced_report=analysis_data.get("enhanced_report", ""),
+    )
+
+
+def _fallback_insights(current_month: str) -> AIInsights:
+    """Return the standard insights used when the AI analysis fails."""
+    return AIInsights(
+        executive_summary=f"Financial analysis for {current_month} 2025 completed with basic metrics.",
+        key_insights=["Analysis completed with standard metrics."],
+        risk_assessment="Standard risk assessment applied.",
+        recommendations=["Continue monitoring financial performance."],
+        trend_analysis="Basic trend analysis completed.",
+        budget_analysis="Budget execution analysis completed.",
+        kpi_analysis="KPI analysis completed."
+    )
+
+
+class FinancialAIAnalyzer:
+    """AI-powered financial analysis using Ollama."""
+    
+    def __init__(self, config: AppConfig, model: str = "llama3.1:8b-instruct-q4_K_M"):
+        """Initialize the AI analyzer.
+        
+        Args:
+            config: Application configuration
+            model: Ollama model to use for analysis
+        """
+        self.config = config
+        self.model = model
+        self.client = _get_client(config.ollama.base_url)
+        
+    def _format_financial_data(self, data: FinancialData, budget: BudgetResult, kpis: KPIResult) -> str:
+        """Format financial data for AI analysis.
+        
+        Args:
+            data: Financial data
+            budget: Budget execution results
+            kpis: KPI results
+            
+        Returns:
+            Formatted string with financial data
+        """
+        return _render_financial_data(
+            data.current_month,
+            float(budget.totals.ingresos_actual),
+            float(budget.totals.gastos_actual),
+            float(budget.totals.pct_ingresos),
+            float(budget.totals.pct_gastos),
+            float(self.config.budgets.ingresos_mensual),
+            float(self.config.budgets.gastos_mensual),
+            float(kpis.metrics.get("Current Ratio", 0)),
+            float(kpis.metrics.get("Margen Bruto %", 0)),
+            float(kpis.metrics.get("Margen Neto %", 0)),
+            float(kpis.metrics.get("ROE %", 0)),
+            float(kpis.metrics.get("EBITDA", 0)),
+            float(budget.gastos_admin),
+            float(budget.gastos_otros),
+            float(budget.costos_venta),
+            float(budget.costos_produccion),
+            tuple(data.months),
+            data.current_month_col,
+        )
+
     def _create_analysis_prompt(self, financial_data: str) -> str:
         """Create a comprehensive prompt for financial analysis.
         
+        The static instructions and JSON schema come first and the financial
+        data last, so Ollama can reuse the cached KV prefix across calls.
+        
         Args:
             financial_data: Formatted financial data string
             
         Returns:
             Analysis prompt
         """
-        return f"""
-You are a senior financial analyst and CFO advisor. Analyze the following financial data and provide comprehensive insights.
-
-{financial_data}
-
-Please provide a detailed analysis in the following JSON format:
-
-{{
-    "executive_summary": "A 2-3 sentence executive summary of the financial performance",
-    "key_insights": [
-        "Key insight 1 about financial performance",
-        "Key insight 2 about trends or patterns",
-        "Key insight 3 about budget execution"
-    ],
-    "risk_assessment": "Assessment of financial risks and concerns",
-    "recommendations": [
-        "Specific actionable recommendation 1",
-        "Specific actionable recommendation 2",
-        "Specific actionable recommendation 3"
-    ],
-    "trend_analysis": "Analysis of trends and patterns in the data",
-    "budget_analysis": "Detailed analysis of budget execution performance",
-    "kpi_analysis": "Analysis of key performance indicators and ratios"
-}}
-
-Focus on:
-1. Financial health and performance
-2. Budget execution efficiency
-3. Risk identification and mitigation
-4. Actionable recommendations for improvement
-5. Trend analysis and forecasting insights
-6. Industry benchmarking where applicable
-
-Provide specific, actionable insights based on the data provided.
-"""
+        return _ANALYSIS_PROMPT_TEMPLATE.format_map(
+            {"schema": _ANALYSIS_SCHEMA, "financial_data": financial_data}
+        )
 
     def analyze_financials(self, data: FinancialData, budget: BudgetResult, kpis: KPIResult) -> AIInsights:
         """Perform AI-powered financial analysis.
@@ -170,68 +343,129 @@ Provide specific, actionable insights based on the data provided.
             prompt = self._create_analysis_prompt(financial_data)
             
             # Get AI analysis
-            logger.info(f"Calling Ollama model: {self.model}")
-            response = self.client.chat(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                options={
-                    "temperature": 0.3,  # Lower temperature for more consistent analysis
-                    "top_p": 0.9,
-                    "num_predict": 2000  # Allow for comprehensive analysis
-                }
-            )
-            
-            # Parse response
-            content = response['message']['content']
-            logger.debug(f"AI Response: {content}")
+            content, json_str = self._stream_json(prompt, self.config.ollama.max_tokens)
             
             # Try to extract JSON from response
             try:
-                # Look for JSON in the response
-                json_start = content.find('{')
-                json_end = content.rfind('}') + 1
-                if json_start != -1 and json_end > json_start:
-                    json_str = content[json_start:json_end]
-                    analysis_data = json.loads(json_str)
-                else:
+                if json_str is None:
                     raise ValueError("No JSON found in response")
+                analysis_data = _json_loads(json_str)
                     
             except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"Failed to parse JSON response: {e}")
+                logger.warning("Failed to parse JSON response: %s", e)
                 # Fallback to text parsing
                 analysis_data = self._parse_text_response(content)
             
-            # Create AIInsights object
-            insights = AIInsights(
-                executive_summary=analysis_data.get("executive_summary", "Analysis completed successfully."),
-                key_insights=analysis_data.get("key_insights", ["Analysis completed."]),
-                risk_assessment=analysis_data.get("risk_assessment", "Risk assessment completed."),
-                recommendations=analysis_data.get("recommendations", ["Continue monitoring financial performance."]),
-                trend_analysis=analysis_data.get("trend_analysis", "Trend analysis completed."),
-                budget_analysis=analysis_data.get("budget_analysis", "Budget analysis completed."),
-                kpi_analysis=analysis_data.get("kpi_analysis", "KPI analysis completed.")
-            )
+            insights = _insights_from_dict(analysis_data)
             
             logger.info("AI financial analysis completed successfully")
             return insights
             
         except Exception as e:
-            logger.error(f"AI analysis failed: {e}")
+            logger.error("AI analysis failed: %s", e)
             # Return fallback insights
-            return AIInsights(
-                executive_summary=f"Financial analysis for {data.current_month} 2025 completed with basic metrics.",
-                key_insights=["Analysis completed with standard metrics."],
-                risk_assessment="Standard risk assessment applied.",
-                recommendations=["Continue monitoring financial performance."],
-                trend_analysis="Basic trend analysis completed.",
-                budget_analysis="Budget execution analysis completed.",
-                kpi_analysis="KPI analysis completed."
-            )
+            return _fallback_insights(data.current_month)
+
+    def analyze_financials_batch(
+        self, items: Sequence[Tuple[FinancialData, BudgetResult, KPIResult]]
+    ) -> List[AIInsights]:
+        """Analyze several reporting periods with a single model call.
+        
+        All periods share one prompt (and one prefill), and the model returns
+        ``{"results": [...]}`` with one analysis per period, in order.
+        
+        Args:
+            items: ``(data, budget, kpis)`` tuples, one per period
+            
+        Returns:
+            AI-generated insights for each period, in the same order
+        """
+        if not items:
+            return []
+
+        try:
+            logger.info("Starting batched AI financial analysis for %s periods...", len(items))
+            blocks = [
+                f"PERIOD {index}:{self._format_financial_data(data, budget, kpis)}"
+                for index, (data, budget, kpis) in enumerate(items, 1)
+            ]
+            prompt = _BATCH_PROMPT_TEMPLATE.format_map({
+                "period_count": len(items),
+                "schema": _ANALYSIS_SCHEMA,
+                "financial_data": "\n".join(blocks),
+            })
+
+            _, json_str = self._stream_json(prompt, self.config.ollama.max_tokens * len(items))
+            if json_str is None:
+                raise ValueError("No JSON found in response")
+            results = _json_loads(json_str).get("results")
+            if not isinstance(results, list) or len(results) != len(items):
+                raise ValueError(f"Expected {len(items)} results in response")
+
+            insights = [_insights_from_dict(result) for result in results]
+            logger.info("Batched AI financial analysis completed successfully")
+            return insights
+
+        except Exception as e:
+            logger.error("Batched AI analysis failed: %s", e)
+            return [_fallback_insights(data.current_month) for data, _, _ in items]
+
+    def _stream_json(self, prompt: str, num_predict: int) -> Tuple[str, Optional[str]]:
+        """Stream a chat completion and stop once its JSON object is closed.
+        
+        Args:
+            prompt: User prompt
+            num_predict: Maximum number of tokens to generate
+            
+        Returns:
+            Tuple of (full response text, JSON object text or None)
+        """
+        logger.info("Calling Ollama model: %s", self.model)
+        stream = self.client.chat(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            options={
+                "temperature": 0.3,  # Lower temperature for more consistent analysis
+                "top_p": 0.9,
+                # Ceiling only: generation stops early once the JSON object closes
+                "num_predict": num_predict,
+                "stop": list(_STOP_SEQUENCES),
+            },
+            keep_alive=self.config.ollama.keep_alive,  # Keep model and prompt cache resident
+            stream=True,
+        )
+
+        # Scan the JSON object while the response is still streaming and
+        # stop generation as soon as it is closed
+        scanner = _JSONObjectScanner()
+        done_reason = None
+        try:
+            for chunk in stream:
+                if scanner.feed(chunk['message']['content']):
+                    break
+                done_reason = chunk.get('done_reason') or done_reason
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        if not scanner.complete:
+            if done_reason == "length":
+                logger.warning(
+                    "AI response hit the %d token limit before its JSON object closed; "
+                    "raise CFOBOT_OLLAMA_MAX_TOKENS",
+                    num_predict,
+                )
+            else:
+                logger.warning("AI response ended before its JSON object closed (done_reason=%s)", done_reason)
+        content = scanner.text
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AI Response: %s", content)
+        return content, scanner.object_text
     
     def _parse_text_response(self, content: str) -> Dict[str, Any]:
         """Parse text response when JSON parsing fails.
@@ -263,6 +497,9 @@ Provide specific, actionable insights based on the data provided.
     def generate_enhanced_report_content(self, data: FinancialData, budget: BudgetResult, kpis: KPIResult, insights: AIInsights) -> str:
         """Generate enhanced report content with AI insights.
         
+        The board-level narrative is requested in the same call as the insights
+        (``enhanced_report`` field), so no additional model round-trip is made.
+        
         Args:
             data: Financial data
             budget: Budget execution results
@@ -272,49 +509,12 @@ Provide specific, actionable insights based on the data provided.
         Returns:
             Enhanced report content
         """
-        prompt = f"""
-You are a professional financial report writer. Create an enhanced executive summary for a board report using the following data and AI insights.
-
-FINANCIAL DATA:
-{self._format_financial_data(data, budget, kpis)}
-
-AI INSIGHTS:
-- Executive Summary: {insights.executive_summary}
-- Key Insights: {', '.join(insights.key_insights)}
-- Risk Assessment: {insights.risk_assessment}
-- Recommendations: {', '.join(insights.recommendations)}
-- Trend Analysis: {insights.trend_analysis}
-- Budget Analysis: {insights.budget_analysis}
-- KPI Analysis: {insights.kpi_analysis}
-
-Create a professional, executive-level report summary that:
-1. Integrates the AI insights naturally
-2. Maintains a professional tone
-3. Provides actionable recommendations
-4. Highlights key financial metrics
-5. Addresses risks and opportunities
-6. Is suitable for board presentation
-
-Format as a comprehensive executive summary (2-3 paragraphs).
-"""
-        
-        try:
-            response = self.client.chat(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                options={"temperature": 0.4, "num_predict": 1000}
-            )
-            return response['message']['content']
-        except Exception as e:
-            logger.error(f"Failed to generate enhanced report content: {e}")
-            return f"""
-Executive Summary - {data.current_month} 2025
-
-{insights.executive_summary}
+        if insights.enhanced_report:
+            return insights.enhanced_report
 
-Key Financial Performance:
-The company's financial performance for {data.current_month} 2025 shows significant insights that require attention. {insights.budget_analysis}
-
-Strategic Recommendations:
-{insights.recommendations[0] if insights.recommendations else "Continue monitoring financial performance."}
-"""
\ No newline at end of file
+        return _FALLBACK_REPORT_TEMPLATE.format_map({
+            "current_month": data.current_month,
+            "executive_summary": insights.executive_summary,
+            "budget_analysis": insights.budget_analysis,
+            "recommendation": insights.recommendations[0] if insights.recommendations else "Continue monitoring financial performance.",
+        })
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import argparse
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 
 from .config import AppConfig, load_config
-from .data_loader import find_latest_report, load_financial_data
+from .data_loader import close_workbooks, find_latest_report, load_financial_data
 from .processing import compute_budget_execution, compute_kpis, consolidate_balance, compute_ai_enhanced_analysis
 from .reporting import (
     build_board_report,
@@ -21,6 +24,33 @@ from .emailer import send_reports
 from .templates import build_email_html, build_ai_enhanced_email_html
 
 
+_QUANT_SUFFIX_RE = re.compile(r"-(?:q\d\w*|fp16|fp32)$", re.IGNORECASE)
+_VARIANT_RE = re.compile(r"(?:^|-)(?:instruct|text|chat)(?:-|$)", re.IGNORECASE)
+QUANTIZATION_CHOICES = ("q4_K_M", "q5_K_M", "q8_0", "fp16")
+
+
+def _apply_quantization(model: str, quant: str) -> str:
+    """Return ``model`` with its tag's quantization suffix set to ``quant``.
+
+    Ollama only publishes quantized builds under a variant tag, so
+    ``llama3.1:8b-instruct-q4_K_M`` with ``q8_0`` becomes
+    ``llama3.1:8b-instruct-q8_0`` and a tag without a variant gets the
+    ``instruct`` one: ``llama3.1:8b`` becomes ``llama3.1:8b-instruct-q8_0``.
+
+    Raises:
+        ValueError: If ``model`` has no tag to pick the model size from
+    """
+    name, sep, tag = model.partition(":")
+    if not sep or not tag:
+        raise ValueError(
+            f"--ai-quant needs a model tag with a size, e.g. {name}:8b (got '{model}')"
+        )
+    base = _QUANT_SUFFIX_RE.sub("", tag)
+    if not _VARIANT_RE.search(base):
+        base = f"{base}-instruct"
+    return f"{name}:{base}-{quant}"
+
+
 def _configure_logging(verbose: bool) -> None:
     level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
@@ -36,31 +66,39 @@ def run_pipeline(config: AppConfig, send_email: bool, skip_visuals: bool, use_ai
     data = load_financial_data(report_path, config, logger)
 
     consolidated = consolidate_balance(data, config)
+    # Both reads are done; later steps only use the loaded frames.
+    close_workbooks()
     budget = compute_budget_execution(data, config)
     kpis = compute_kpis(data, budget)
 
-    outputs = [
-        save_consolidated_balance(consolidated, data),
-        save_budget_execution(budget, data),
-        save_kpis(kpis, data),
-    ]
-
-    if not skip_visuals and config.generate_visuals:
-        figures_paths = generate_all_figures(budget, kpis, data)
-        outputs.extend(figures_paths)
-
-    diferencia = extract_caratula_difference(data)
-    
-    # Generate AI-enhanced analysis if enabled
+    # Generate AI-enhanced analysis if enabled. The Ollama call is network-bound,
+    # so it runs in a worker thread while the Excel outputs and charts are written.
     ai_insights = None
-    if use_ai and config.ollama.enabled:
-        try:
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="cfobot-ai") as executor:
+        ai_future = None
+        if use_ai and config.ollama.enabled:
             logger.info("Generating AI-enhanced analysis...")
-            ai_insights = compute_ai_enhanced_analysis(data, budget, kpis, config)
-            logger.info("AI analysis completed successfully")
-        except Exception as e:
-            logger.warning(f"AI analysis failed, falling back to standard analysis: {e}")
-            ai_insights = None
+            ai_future = executor.submit(compute_ai_enhanced_analysis, data, budget, kpis, config)
+
+        outputs = [
+            save_consolidated_balance(consolidated, data),
+            save_budget_execution(budget, data),
+            save_kpis(kpis, data),
+        ]
+
+        if not skip_visuals and config.generate_visuals:
+            figures_paths = generate_all_figures(budget, kpis, data)
+            outputs.extend(figures_paths)
+
+        diferencia = extract_caratula_difference(data)
+
+        if ai_future is not None:
+            try:
+                ai_insights = ai_future.result()
+                logger.info("AI analysis completed successfully")
+            except Exception as e:
+                logger.warning("AI analysis failed, falling back to standard analysis: %s", e)
+                ai_insights = None
     
     # Generate appropriate board report
     if ai_insights:
@@ -125,7 +163,12 @@ def main(argv: list[str] | None = None) -> None:
     parser.add_argument(
         "--ai-model",
         type=str,
-        help="Modelo de IA a usar (ej: llama3.1:8b, mistral:7b)",
+        help="Modelo de IA a usar (ej: llama3.1:8b-instruct-q4_K_M, mistral:7b)",
+    )
+    parser.add_argument(
+        "--ai-quant",
+        choices=QUANTIZATION_CHOICES,
+        help="Cuantización del modelo de IA (sufijo del tag, ej: q4_K_M; sin variante se usa -instruct)",
     )
 
     args = parser.parse_args(argv)
@@ -134,8 +177,14 @@ def main(argv: list[str] | None = None) -> None:
     config = load_config()
     
     # Override AI settings if specified
-    if args.ai_model:
-        config.ollama.model = args.ai_model
+    model = args.ai_model or config.ollama.model
+    if args.ai_quant:
+        try:
+            model = _apply_quantization(model, args.ai_quant)
+        except ValueError as e:
+            parser.error(str(e))
+    if model != config.ollama.model:
+        config = replace(config, ollama=replace(config.ollama, model=model))
     
     use_ai = not args.no_ai and config.ollama.enabled
     
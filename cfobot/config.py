@@ -2,25 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import fnmatch
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
-
-DEFAULT_MONTH_ORDER: List[str] = [
-    "ENERO",
-    "FEBRERO",
-    "MARZO",
-    "ABRIL",
-    "MAYO",
-    "JUNIO",
-    "JULIO",
-    "AGOSTO",
-    "SEPTIEMBRE",
-    "OCTUBRE",
-    "NOVIEMBRE",
-    "DICIEMBRE",
-]
+from typing import Iterable, List, Tuple
+
+# Month constants live in constants.py; re-exported here for existing imports.
+from .constants import DEFAULT_MONTH_ORDER, MONTH_INDEX  # noqa: F401
 
 
 @dataclass
@@ -31,6 +22,26 @@ class PathConfig:
     def expand_pattern(self) -> str:
         return str(self.downloads_dir / self.report_pattern)
 
+    def list_reports(self) -> List[os.DirEntry]:
+        """Return the regular files matching ``report_pattern``.
+
+        The pattern is matched against file names with a single ``os.scandir``
+        pass instead of ``glob``; as with ``glob``, hidden files are skipped and
+        a missing directory yields no matches.
+        """
+        pattern = Path(self.expand_pattern())
+        try:
+            with os.scandir(pattern.parent) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and fnmatch.fnmatchcase(entry.name, pattern.name)
+                    and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
 
 @dataclass
 class BudgetConfig:
@@ -70,34 +81,58 @@ class EmailConfig:
 
 @dataclass
 class OllamaConfig:
+    """Ollama connection settings.
+
+    The AI step runs concurrently with chart rendering; set ``OLLAMA_NUM_PARALLEL``
+    on the Ollama server to let it serve more than one request at a time.
+    """
+
     enabled: bool = True
-    model: str = "llama3.1:8b"
+    model: str = "llama3.1:8b-instruct-q4_K_M"
     base_url: str = "http://localhost:11434"
     temperature: float = 0.3
     max_tokens: int = 2000
+    keep_alive: str = "30m"
 
 @dataclass
 class AppConfig:
-    paths: PathConfig = PathConfig()
-    budgets: BudgetConfig = BudgetConfig()
-    month_order: List[str] = field(default_factory=lambda: DEFAULT_MONTH_ORDER.copy())
+    paths: PathConfig = field(default_factory=PathConfig)
+    budgets: BudgetConfig = field(default_factory=BudgetConfig)
+    month_order: Tuple[str, ...] = DEFAULT_MONTH_ORDER
     email: EmailConfig | None = field(default=None)
     generate_visuals: bool = True
-    ollama: OllamaConfig = OllamaConfig()
+    ollama: OllamaConfig = field(default_factory=OllamaConfig)
+
+
+_ENV_PREFIX = "CFOBOT_"
 
 
 def load_config() -> AppConfig:
-    """Load configuration from environment."""
+    """Load configuration from environment.
+
+    The environment is parsed once per snapshot of the ``CFOBOT_*``
+    variables. Each call returns its own copy of the cached configuration,
+    so callers may mutate it without affecting later calls.
+    """
+    env_snapshot = tuple(
+        sorted((key, value) for key, value in os.environ.items() if key.startswith(_ENV_PREFIX))
+    )
+    return copy.deepcopy(_load_config_cached(env_snapshot))
+
 
+@lru_cache(maxsize=8)
+def _load_config_cached(env_snapshot: Tuple[Tuple[str, str], ...]) -> AppConfig:
+    environ = dict(env_snapshot)
     email_config = EmailConfig.from_env()
     
     # Load Ollama configuration from environment
     ollama_config = OllamaConfig(
-        enabled=os.getenv("CFOBOT_OLLAMA_ENABLED", "true").lower() == "true",
-        model=os.getenv("CFOBOT_OLLAMA_MODEL", "llama3.1:8b"),
-        base_url=os.getenv("CFOBOT_OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=float(os.getenv("CFOBOT_OLLAMA_TEMPERATURE", "0.3")),
-        max_tokens=int(os.getenv("CFOBOT_OLLAMA_MAX_TOKENS", "2000"))
+        enabled=environ.get("CFOBOT_OLLAMA_ENABLED", "true").lower() == "true",
+        model=environ.get("CFOBOT_OLLAMA_MODEL", "llama3.1:8b-instruct-q4_K_M"),
+        base_url=environ.get("CFOBOT_OLLAMA_BASE_URL", "http://localhost:11434"),
+        temperature=float(environ.get("CFOBOT_OLLAMA_TEMPERATURE", "0.3")),
+        max_tokens=int(environ.get("CFOBOT_OLLAMA_MAX_TOKENS", "2000")),
+        keep_alive=environ.get("CFOBOT_OLLAMA_KEEP_ALIVE", "30m"),
     )
 
     config = AppConfig(email=email_config, ollama=ollama_config)
@@ -6,6 +6,14 @@ OTHER_EXPENSES_PATTERN = r"^53[0-9]{4,}"
 SALES_COSTS_PATTERN = r"^61[0-9]{4,}"
 PRODUCTION_COSTS_PATTERN = r"^(72|73)[0-9]{4,}"
 
+# The same categories as two-digit prefixes of detail (auxiliary) accounts,
+# which carry at least DETAIL_ACCOUNT_DIGITS leading digits.
+ADMIN_EXPENSES_PREFIXES = (51,)
+OTHER_EXPENSES_PREFIXES = (53,)
+SALES_COSTS_PREFIXES = (61,)
+PRODUCTION_COSTS_PREFIXES = (72, 73)
+DETAIL_ACCOUNT_DIGITS = 6
+
 # Financial thresholds and limits
 MIN_CURRENT_RATIO = 1.5
 MIN_NET_MARGIN = 5.0
@@ -43,9 +51,9 @@ SALARY_PATTERNS = ["SUELDO", "SALARIO"]
 SEVERANCE_PATTERNS = ["CESANTIA"]
 
 # Month order for processing
-DEFAULT_MONTH_ORDER = [
+DEFAULT_MONTH_ORDER = (
     "ENERO",
-    "FEBRERO", 
+    "FEBRERO",
     "MARZO",
     "ABRIL",
     "MAYO",
@@ -56,22 +64,31 @@ DEFAULT_MONTH_ORDER = [
     "OCTUBRE",
     "NOVIEMBRE",
     "DICIEMBRE",
-]
+)
+
+MONTH_INDEX = {month: index for index, month in enumerate(DEFAULT_MONTH_ORDER)}
 
 # Month aliases for flexible matching
 MONTH_ALIASES = {
-    "ENERO": {"ENERO", "ENE"},
-    "FEBRERO": {"FEBRERO", "FEB"},
-    "MARZO": {"MARZO", "MAR"},
-    "ABRIL": {"ABRIL", "ABR"},
-    "MAYO": {"MAYO", "MAY"},
-    "JUNIO": {"JUNIO", "JUN"},
-    "JULIO": {"JULIO", "JUL"},
-    "AGOSTO": {"AGOSTO", "AGO"},
-    "SEPTIEMBRE": {"SEPTIEMBRE", "SEP"},
-    "OCTUBRE": {"OCTUBRE", "OCT"},
-    "NOVIEMBRE": {"NOVIEMBRE", "NOV"},
-    "DICIEMBRE": {"DICIEMBRE", "DIC"},
+    "ENERO": frozenset(("ENERO", "ENE")),
+    "FEBRERO": frozenset(("FEBRERO", "FEB")),
+    "MARZO": frozenset(("MARZO", "MAR")),
+    "ABRIL": frozenset(("ABRIL", "ABR")),
+    "MAYO": frozenset(("MAYO", "MAY")),
+    "JUNIO": frozenset(("JUNIO", "JUN")),
+    "JULIO": frozenset(("JULIO", "JUL")),
+    "AGOSTO": frozenset(("AGOSTO", "AGO")),
+    "SEPTIEMBRE": frozenset(("SEPTIEMBRE", "SEP")),
+    "OCTUBRE": frozenset(("OCTUBRE", "OCT")),
+    "NOVIEMBRE": frozenset(("NOVIEMBRE", "NOV")),
+    "DICIEMBRE": frozenset(("DICIEMBRE", "DIC")),
+}
+
+# Reverse lookup: every alias (the full name included) to its canonical month
+ALIAS_TO_MONTH = {
+    alias: month
+    for month, aliases in MONTH_ALIASES.items()
+    for alias in aliases
 }
 
 # Balance sheet account codes
@@ -2,60 +2,93 @@
 
 from __future__ import annotations
 
-import glob
-from dataclasses import dataclass
+import importlib.util
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Sequence, Tuple, TypeVar
 
-import unicodedata
-
-import pandas as pd
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 from .config import AppConfig
+from .constants import ALIAS_TO_MONTH, DEFAULT_MONTH_ORDER, MONTH_INDEX
+
+
+# Rust-backed reader (python-calamine); far faster than openpyxl/xlrd.
+EXCEL_ENGINE = "calamine"
+
+# Arrow-backed strings run the .str kernels used for account classification
+# natively; without pyarrow the label columns stay as object dtype. Only the
+# spec is looked up so importing this module stays cheap.
+STRING_DTYPE: str | None = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else None
+)
+
+# Balance sheets only carry seven meaningful columns (Nivel .. Saldo final).
+BALANCE_COLUMNS = "A:G"
+BALANCE_COLUMN_NAMES: Tuple[str, ...] = (
+    "Nivel",
+    "Código cuenta contable",
+    "Nombre cuenta contable",
+    "Saldo inicial",
+    "Movimiento débito",
+    "Movimiento crédito",
+    "Saldo final",
+)
+# Title rows plus the sheet's own header row, replaced by BALANCE_COLUMN_NAMES.
+_BALANCE_SKIPROWS = 5
+
+# A month is a whole whitespace-separated token once "DE" is blanked out, so
+# ranges such as "ACUM ENE-MAR" or "ENERO-DICIEMBRE" name no month. Longest
+# aliases first so "SEPTIEMBRE" wins over "SEP".
+_MONTH_RE = re.compile(
+    r"(?<!\S)(" + "|".join(sorted(ALIAS_TO_MONTH, key=len, reverse=True)) + r")(?!\S)"
+)
+
+# Month slot of the standard report name, e.g. "INFORME DE ABRIL APRU- 2025 .xls".
+_FILENAME_MONTH_RE = re.compile(r"DE\s+(\w+)\s+APRU", re.IGNORECASE)
+
+_MONTH_NAMES_RE = re.compile("|".join(map(re.escape, DEFAULT_MONTH_ORDER)))
+
+# Combining diacritical marks (U+0300-U+036F), removed after NFD decomposition.
+_COMBINING_MARKS = dict.fromkeys(range(0x0300, 0x0370))
+
+
+@lru_cache(maxsize=2048)
+def _strip_accents(value: str) -> str:
+    if value.isascii():
+        return value
+    import unicodedata
 
+    return unicodedata.normalize("NFD", value).translate(_COMBINING_MARKS)
 
-MONTH_ALIASES: Dict[str, set[str]] = {
-    "ENERO": {"ENERO", "ENE"},
-    "FEBRERO": {"FEBRERO", "FEB"},
-    "MARZO": {"MARZO", "MAR"},
-    "ABRIL": {"ABRIL", "ABR"},
-    "MAYO": {"MAYO", "MAY"},
-    "JUNIO": {"JUNIO", "JUN"},
-    "JULIO": {"JULIO", "JUL"},
-    "AGOSTO": {"AGOSTO", "AGO"},
-    "SEPTIEMBRE": {"SEPTIEMBRE", "SEP"},
-    "OCTUBRE": {"OCTUBRE", "OCT"},
-    "NOVIEMBRE": {"NOVIEMBRE", "NOV"},
-    "DICIEMBRE": {"DICIEMBRE", "DIC"},
-}
-
-ALIAS_TO_MONTH: Dict[str, str] = {
-    alias: month
-    for month, aliases in MONTH_ALIASES.items()
-    for alias in aliases
-}
 
+@lru_cache(maxsize=2048)
+def _resolve_month(label: str) -> str | None:
+    if not isinstance(label, str):
+        return None
+    match = _MONTH_RE.search(_strip_accents(label.upper()).replace("DE", " "))
+    return ALIAS_TO_MONTH[match.group(1)] if match else None
 
-def _strip_accents(value: str) -> str:
-    return "".join(
-        c for c in unicodedata.normalize("NFD", value) if unicodedata.category(c) != "Mn"
-    )
 
+def _resolve_month_ascii(label: str) -> str | None:
+    """Resolve a month from plain ASCII text such as a report file name.
 
-def _extract_month_tokens(text: str) -> List[str]:
-    if not isinstance(text, str):
-        return []
-    upper = _strip_accents(text.upper())
-    cleaned = upper.replace("DE", " ")
-    return [part for part in cleaned.split() if part.isalpha()]
+    Skips the accent-stripping step of ``_resolve_month``; non-ASCII labels
+    still go through the full path.
+    """
+    if not label.isascii():
+        return _resolve_month(label)
+    match = _MONTH_RE.search(label.upper().replace("DE", " "))
+    return ALIAS_TO_MONTH[match.group(1)] if match else None
 
 
-def _resolve_month(label: str) -> str | None:
-    for token in _extract_month_tokens(label):
-        month = ALIAS_TO_MONTH.get(token)
-        if month:
-            return month
-    return None
+_T = TypeVar("_T")
 
 
 @dataclass
@@ -68,40 +101,112 @@ class FinancialData:
     resultado: pd.DataFrame
     caratula: pd.DataFrame
     months: Sequence[str]
-    workbook: pd.ExcelFile
+    # Only the sheet names and the file location are kept, not the parsed
+    # workbook; sheets needed later are read again from ``source_path``.
+    sheet_names: Tuple[str, ...] = ()
+    source_path: Path | None = None
+    _derived: Dict[str, Tuple[Any, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def cached(self, key: str, source: Any, build: Callable[[Any], _T]) -> _T:
+        """Return ``build(source)``, memoized while ``source`` stays the same object.
+
+        Used for values derived from the frames, such as regex row masks, so
+        the processing steps share them; assigning a new frame invalidates
+        the entry.
+
+        Args:
+            key: Name of the derived value
+            source: Object the value is derived from, e.g. ``self.eri``
+            build: Function computing the value from ``source``
+
+        Returns:
+            The memoized or freshly built value
+        """
+        entry = self._derived.get(key)
+        if entry is None or entry[0] is not source:
+            entry = (source, build(source))
+            self._derived[key] = entry
+        return entry[1]
+
+    def eri_month_values(self) -> np.ndarray:
+        """Return the ERI month columns as one read-only float64 matrix.
+
+        The matrix (rows x ``months``) is built once per ERI frame and shared
+        by the processing and reporting steps. Amounts keep their sign and
+        missing values stay NaN; callers take magnitudes as they need them.
+        """
+        months = list(self.months)
+
+        def build(eri: pd.DataFrame) -> np.ndarray:
+            values = eri[months].to_numpy(dtype="float64", copy=True)
+            values.setflags(write=False)
+            return values
+
+        return self.cached("eri_month_values", self.eri, build)
 
 
 def find_latest_report(config: AppConfig, logger) -> Path:
-    pattern = config.paths.expand_pattern()
-    files = glob.glob(pattern)
-    if not files:
-        raise FileNotFoundError(f"No file matching '{pattern}' found")
+    # One stat() per candidate; DirEntry caches it and is_file() uses d_type.
+    # Integer nanoseconds avoid float rounding between files saved close together.
+    latest = None
+    latest_mtime = -1
+    for entry in config.paths.list_reports():
+        mtime = entry.stat().st_mtime_ns
+        if mtime > latest_mtime:
+            latest, latest_mtime = entry, mtime
+
+    if latest is None:
+        raise FileNotFoundError(f"No file matching '{config.paths.expand_pattern()}' found")
 
-    latest = max(files, key=lambda path: Path(path).stat().st_mtime)
-    logger.info("Using report file: %s", latest)
-    return Path(latest)
+    logger.info("Using report file: %s", latest.path)
+    return Path(latest.path)
+
+
+def _month_index(month_order: Sequence[str]) -> Dict[str, int]:
+    """Return a month -> position mapping, reusing the precomputed default."""
+    if month_order is DEFAULT_MONTH_ORDER:
+        return MONTH_INDEX
+    return {month: index for index, month in enumerate(month_order)}
+
+
+def _month_names_pattern(month_order: Sequence[str]) -> re.Pattern[str]:
+    """Return a regex matching any configured month name, reusing the default."""
+    if month_order is DEFAULT_MONTH_ORDER:
+        return _MONTH_NAMES_RE
+    return _compile_month_names(tuple(month_order))
+
+
+@lru_cache(maxsize=8)
+def _compile_month_names(month_order: Tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, month_order)))
 
 
 def _detect_month_from_filename(file_path: Path) -> str | None:
-    return _resolve_month(file_path.name)
+    match = _FILENAME_MONTH_RE.search(file_path.name)
+    if match:
+        month = ALIAS_TO_MONTH.get(match.group(1).upper())
+        if month is not None:
+            return month
+    # Non-standard names: look for a month anywhere in the name.
+    return _resolve_month_ascii(file_path.name)
 
 
 def _detect_month_from_sheet_names(
     sheet_names: Sequence[str],
     month_order: Sequence[str],
 ) -> str | None:
-    ordered_months = {month: index for index, month in enumerate(month_order)}
-    detected: List[str] = []
+    ordered_months = _month_index(month_order)
+    latest: str | None = None
+    latest_index = -1
     for sheet_name in sheet_names:
         month = _resolve_month(sheet_name)
-        if month and month in ordered_months:
-            detected.append(month)
-
-    if not detected:
-        return None
-
-    detected = sorted(set(detected), key=lambda m: ordered_months[m])
-    return detected[-1]
+        if month is not None:
+            index = ordered_months.get(month, -1)
+            if index > latest_index:
+                latest, latest_index = month, index
+    return latest
 
 
 def _detect_month_from_caratula(
@@ -109,26 +214,25 @@ def _detect_month_from_caratula(
     month_order: Sequence[str],
 ) -> str | None:
     """Detect month from CARATULA sheet content."""
+    import pandas as pd
+
     try:
         df_caratula = pd.read_excel(workbook, sheet_name="CARATULA")
-        ordered_months = {month: index for index, month in enumerate(month_order)}
-        
-        for col in df_caratula.columns:
-            for idx, val in df_caratula[col].items():
-                if pd.notna(val):
-                    val_str = str(val).upper()
-                    for month in month_order:
-                        if month in val_str:
-                            return month
+        # Column-major, like reading the sheet column by column
+        cells = df_caratula.unstack().dropna().astype(str).str.upper()
+        hits = cells[cells.str.contains(_month_names_pattern(month_order))]
+        if not hits.empty:
+            first_hit = hits.iloc[0]
+            return next(month for month in month_order if month in first_hit)
     except Exception:
         pass
     return None
 
 
 def _previous_month(month: str, month_order: Sequence[str]) -> str:
-    if month not in month_order:
+    index = _month_index(month_order).get(month)
+    if index is None:
         raise ValueError(f"Month '{month}' is not in configured month order")
-    index = month_order.index(month)
     return month_order[index - 1] if index > 0 else month_order[-1]
 
 
@@ -173,15 +277,9 @@ def detect_current_month(
 
 
 def _normalize_balance(df_balance: pd.DataFrame, current_month: str, month_order: Sequence[str]) -> pd.DataFrame:
-    expected_cols = [
-        "Nivel",
-        "Código cuenta contable",
-        "Nombre cuenta contable",
-        "Saldo inicial",
-        "Movimiento débito",
-        "Movimiento crédito",
-        "Saldo final",
-    ]
+    import pandas as pd
+
+    expected_cols = list(BALANCE_COLUMN_NAMES)
     if len(df_balance.columns) >= len(expected_cols):
         extra_count = len(df_balance.columns) - len(expected_cols)
         df_balance.columns = expected_cols + [f"Extra_{i}" for i in range(extra_count)]
@@ -189,36 +287,51 @@ def _normalize_balance(df_balance: pd.DataFrame, current_month: str, month_order
         df_balance.columns = [f"Col_{i}" for i in range(len(df_balance.columns))]
 
     df_balance["Saldo final"] = pd.to_numeric(df_balance.get("Saldo final", 0), errors="coerce").fillna(0)
-    df_balance["Nivel"] = df_balance.get("Nivel", "").astype(str).fillna("")
+    # A handful of levels (Clase, Grupo, Cuenta, ...): as a categorical the
+    # level filters compare small integer codes instead of strings.
+    df_balance["Nivel"] = df_balance.get("Nivel", "").astype(str).fillna("").astype("category")
     return df_balance
 
 
+def _as_string_columns(df: pd.DataFrame, columns: Sequence[str]) -> None:
+    """Cast label columns to ``STRING_DTYPE`` in place when it is available."""
+    if STRING_DTYPE is None:
+        return
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column].astype(STRING_DTYPE)
+
+
+def _head_months(df: pd.DataFrame, rows: int = 3) -> pd.DataFrame:
+    """Resolve the month named in each of the first ``rows`` cells per column."""
+    head = df.head(rows).astype(str).apply(lambda column: column.str.upper())
+    return head.apply(lambda column: column.map(_resolve_month))
+
+
 def _normalize_eri(
     df_eri: pd.DataFrame,
     current_month: str,
     month_order: Sequence[str],
+    month_index: Mapping[str, int] | None = None,
 ) -> tuple[pd.DataFrame, List[str], str]:
-    df_eri = df_eri.copy()
+    import pandas as pd
+
+    # Normalized in place: the frame comes straight from read_excel and the
+    # caller does not keep the raw sheet.
     df_eri.columns = [str(col).strip() for col in df_eri.columns]
 
-    month_index = {month: index for index, month in enumerate(month_order)}
-    month_columns: List[str] = []
+    if month_index is None:
+        month_index = _month_index(month_order)
     
     # First, try to find month names in column headers
-    for column in df_eri.columns:
-        column_str = str(column)
-        if _resolve_month(column_str) is not None:
-            month_columns.append(column_str)
+    month_columns = [column for column in df_eri.columns if _resolve_month(column) is not None]
     
-    # If no month columns found in headers, look in the first row of data
+    # If no month columns found in headers, look in the first rows of data
+    head_months = None
     if not month_columns:
-        for col_idx, column in enumerate(df_eri.columns):
-            # Check the first few rows for month names
-            for row_idx in range(min(3, len(df_eri))):
-                cell_value = str(df_eri.iloc[row_idx, col_idx]).upper()
-                if _resolve_month(cell_value) is not None:
-                    month_columns.append(column)
-                    break
+        head_months = _head_months(df_eri)
+        has_month = head_months.notna().any().to_numpy()
+        month_columns = [column for column, hit in zip(df_eri.columns, has_month) if hit]
     
     month_columns_sorted = sorted(
         month_columns,
@@ -231,15 +344,13 @@ def _normalize_eri(
     df_eri.columns = ["Codigo", "Nombre"] + list(df_eri.columns[2:-1]) + ["Observaciones"]
     df_eri["Codigo"] = df_eri["Codigo"].astype(str).fillna("")
     df_eri["Nombre"] = df_eri["Nombre"].astype(str).fillna("")
-    df_eri["Display Name"] = (
-        df_eri.apply(
-            lambda row: row["Nombre"] if row["Nombre"].strip() else row["Codigo"],
-            axis=1,
-        )
+    df_eri["Display Name"] = df_eri["Nombre"].where(
+        df_eri["Nombre"].str.strip() != "", df_eri["Codigo"]
     )
 
-    for col in month_columns_sorted:
-        df_eri[col] = pd.to_numeric(df_eri[col], errors="coerce").fillna(0)
+    df_eri[month_columns_sorted] = (
+        df_eri[month_columns_sorted].apply(pd.to_numeric, errors="coerce").fillna(0)
+    )
 
     # Find the column that contains the current month data
     preferred_column = None
@@ -251,15 +362,14 @@ def _normalize_eri(
     
     # If not found by column name, look for the column with current month in the data
     if preferred_column is None:
-        for col in df_eri.columns:
-            for row_idx in range(min(3, len(df_eri))):
-                cell_value = str(df_eri.iloc[row_idx, col]).upper()
-                if current_month in cell_value:
-                    preferred_column = col
-                    break
-            if preferred_column:
-                break
+        if head_months is None:
+            head_months = _head_months(df_eri)
+        is_current = (head_months == current_month).any().to_numpy()
+        preferred_column = next(
+            (column for column, hit in zip(df_eri.columns, is_current) if hit), None
+        )
     
+    _as_string_columns(df_eri, ("Codigo", "Nombre", "Display Name"))
     current_month_col = preferred_column or month_columns_sorted[-1]
     return df_eri, month_columns_sorted, current_month_col
 
@@ -268,10 +378,12 @@ def _normalize_resultado(
     df_resultado: pd.DataFrame,
     current_month: str,
     month_order: Sequence[str],
+    month_index: Mapping[str, int] | None = None,
 ) -> tuple[pd.DataFrame, str]:
-    df_resultado = df_resultado.copy()
+    import pandas as pd
 
-    month_index = {month: index for index, month in enumerate(month_order)}
+    if month_index is None:
+        month_index = _month_index(month_order)
 
     descripcion_series = None
     normalized = None
@@ -306,16 +418,15 @@ def _normalize_resultado(
             df_resultado.insert(0, "Descripcion", "")
         df_resultado["Descripcion"] = df_resultado["Descripcion"].astype(str).str.strip()
         
-        # Look for month columns in the data (not just headers)
+        # Look for month columns in the data (not just headers); keep the
+        # first configured month found in each column.
+        head_months = _head_months(df_resultado)
+        head_months = head_months.where(head_months.isin(list(month_index))).to_numpy()
         month_columns = []
-        for col_idx, column in enumerate(df_resultado.columns):
-            # Check the first few rows for month names
-            for row_idx in range(min(3, len(df_resultado))):
-                cell_value = str(df_resultado.iloc[row_idx, col_idx]).upper()
-                month_name = _resolve_month(cell_value)
-                if month_name and month_name in month_index:
-                    month_columns.append((column, month_name))
-                    break
+        for column, candidates in zip(df_resultado.columns, head_months.T):
+            month_name = next((month for month in candidates if isinstance(month, str)), None)
+            if month_name is not None:
+                month_columns.append((column, month_name))
         
         # Create normalized dataframe with month columns
         normalized = df_resultado[["Descripcion"]].copy()
@@ -341,14 +452,108 @@ def _normalize_resultado(
         )
         current_total_column = sorted_columns[-1]
 
-    for col in normalized.columns:
-        if col == "Descripcion" or not col.startswith("Total "):
-            continue
-        normalized[col] = pd.to_numeric(normalized[col], errors="coerce").fillna(0)
+    normalized[total_columns] = (
+        normalized[total_columns].apply(pd.to_numeric, errors="coerce").fillna(0)
+    )
 
+    _as_string_columns(normalized, ("Descripcion",))
     return normalized, current_total_column
 
 
+def read_balance_sheets(
+    source: Path | str | pd.ExcelFile,
+    sheet_names: Sequence[str],
+) -> Dict[str, pd.DataFrame]:
+    """Read the given BALANCE sheets, keeping only their first seven columns.
+
+    The sheet's header row is skipped and the columns are labelled with
+    ``BALANCE_COLUMN_NAMES`` directly, so callers need not rename them.
+
+    Args:
+        source: Path to the Excel report, or an already open ``pd.ExcelFile``
+        sheet_names: Names of the balance sheets to read
+
+    Returns:
+        Mapping of sheet name to its raw DataFrame
+    """
+    import pandas as pd
+
+    sheet_names = list(sheet_names)
+    try:
+        return pd.read_excel(
+            source,
+            sheet_name=sheet_names,
+            header=None,
+            skiprows=_BALANCE_SKIPROWS,
+            names=list(BALANCE_COLUMN_NAMES),
+            usecols=BALANCE_COLUMNS,
+            engine=EXCEL_ENGINE,
+        )
+    except pd.errors.ParserError:
+        # A sheet narrower than A:G; read them whole and name what is there.
+        frames = pd.read_excel(
+            source,
+            sheet_name=sheet_names,
+            header=None,
+            skiprows=_BALANCE_SKIPROWS,
+            engine=EXCEL_ENGINE,
+        )
+        width = len(BALANCE_COLUMN_NAMES)
+        for sheet_name, frame in frames.items():
+            frame = frame.iloc[:, :width].copy()
+            frame.columns = list(BALANCE_COLUMN_NAMES[: len(frame.columns)])
+            frames[sheet_name] = frame
+        return frames
+
+
+# Opened workbooks by (path, mtime_ns, size), oldest first. Each entry keeps a
+# file handle and the reader's parsed state alive until it is evicted or
+# ``close_workbooks`` runs, so long-lived processes should call the latter once
+# a report has been loaded and consolidated.
+_WORKBOOK_CACHE_SIZE = 4
+_open_workbooks: OrderedDict[Tuple[str, int, int], pd.ExcelFile] = OrderedDict()
+
+
+def _open_workbook(path: str, mtime_ns: int, size: int) -> pd.ExcelFile:
+    """Open (and parse) a workbook once per file version.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is re-opened. Workbooks pushed out of the cache are closed.
+    """
+    import pandas as pd
+
+    key = (path, mtime_ns, size)
+    workbook = _open_workbooks.pop(key, None)
+    if workbook is None:
+        workbook = pd.ExcelFile(path, engine=EXCEL_ENGINE)
+    _open_workbooks[key] = workbook
+    while len(_open_workbooks) > _WORKBOOK_CACHE_SIZE:
+        _, evicted = _open_workbooks.popitem(last=False)
+        evicted.close()
+    return workbook
+
+
+def open_workbook(path: Path | str) -> pd.ExcelFile:
+    """Return the cached ``pd.ExcelFile`` for the current version of ``path``.
+
+    Args:
+        path: Path to the Excel report
+
+    Returns:
+        Open workbook, shared with other callers until the file changes or
+        ``close_workbooks`` is called
+    """
+    stat = Path(path).stat()
+    return _open_workbook(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def close_workbooks() -> None:
+    """Close every cached workbook and release its file handle."""
+    while _open_workbooks:
+        _, workbook = _open_workbooks.popitem()
+        workbook.close()
+
+
 def load_financial_data(file_path: Path, config: AppConfig, logger) -> FinancialData:
     """Load and validate financial data from Excel file.
     
@@ -364,7 +569,9 @@ def load_financial_data(file_path: Path, config: AppConfig, logger) -> Financial
         ValueError: If required sheets are missing or data is invalid
         FileNotFoundError: If file doesn't exist
     """
-    workbook = pd.ExcelFile(file_path)
+    import pandas as pd
+
+    workbook = open_workbook(file_path)
     logger.debug("Available sheets: %s", workbook.sheet_names)
 
     current_month = detect_current_month(
@@ -400,25 +607,42 @@ def load_financial_data(file_path: Path, config: AppConfig, logger) -> Financial
             f"Available sheets: {available_sheets}"
         )
 
+    # The sheets are parsed concurrently. Each read opens its own handle on the
+    # file because a shared ExcelFile reader is not safe to use across threads.
     try:
-        df_balance = pd.read_excel(workbook, sheet_name=balance_sheet, skiprows=4)
-        df_eri = pd.read_excel(workbook, sheet_name="INFORME-ERI", skiprows=1)
-        df_resultado = pd.read_excel(
-            workbook,
-            sheet_name="ESTADO RESULTADO",
-            skiprows=2,
-            header=[0, 1],
-        )
-        df_caratula = pd.read_excel(workbook, sheet_name="CARATULA", skiprows=5)
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="cfobot-xls") as executor:
+            balance_future = executor.submit(read_balance_sheets, file_path, [balance_sheet])
+            eri_future = executor.submit(
+                pd.read_excel, file_path, sheet_name="INFORME-ERI", skiprows=1, engine=EXCEL_ENGINE
+            )
+            resultado_future = executor.submit(
+                pd.read_excel,
+                file_path,
+                sheet_name="ESTADO RESULTADO",
+                skiprows=2,
+                header=[0, 1],
+                engine=EXCEL_ENGINE,
+            )
+            caratula_future = executor.submit(
+                pd.read_excel, file_path, sheet_name="CARATULA", skiprows=5, engine=EXCEL_ENGINE
+            )
+            df_balance = balance_future.result()[balance_sheet]
+            df_eri = eri_future.result()
+            df_resultado = resultado_future.result()
+            df_caratula = caratula_future.result()
     except Exception as e:
         raise ValueError(f"Failed to read Excel sheets: {e}")
 
     df_balance = _normalize_balance(df_balance, current_month, config.month_order)
-    df_eri, months, current_month_col = _normalize_eri(df_eri, current_month, config.month_order)
+    month_index = _month_index(config.month_order)
+    df_eri, months, current_month_col = _normalize_eri(
+        df_eri, current_month, config.month_order, month_index
+    )
     df_resultado, current_resultado_col = _normalize_resultado(
         df_resultado,
         current_month=current_month,
         month_order=config.month_order,
+        month_index=month_index,
     )
 
     return FinancialData(
@@ -430,5 +654,6 @@ def load_financial_data(file_path: Path, config: AppConfig, logger) -> Financial
         resultado=df_resultado,
         caratula=df_caratula,
         months=months,
-        workbook=workbook,
+        sheet_names=tuple(workbook.sheet_names),
+        source_path=Path(file_path),
     )
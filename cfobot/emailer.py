@@ -2,22 +2,237 @@
 
 from __future__ import annotations
 
+import binascii
 import logging
 import smtplib
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email import encoders
+import ssl
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from .config import EmailConfig
 
+if TYPE_CHECKING:
+    from email.charset import Charset
+    from email.message import Message
+    from email.mime.base import MIMEBase
+
 logger = logging.getLogger(__name__)
 
+# 57 input bytes encode to one 76-character base64 line (RFC 2045); reading a
+# multiple of 57 keeps every chunk on line boundaries. 4608 lines is ~256 KiB.
+_B64_LINE_BYTES = 57
+_B64_CHUNK_BYTES = _B64_LINE_BYTES * 4608
+
+# Textual attachments are sent as 8bit UTF-8 text parts instead of base64.
+_TEXT_SUBTYPES = {
+    ".csv": "csv",
+    ".htm": "html",
+    ".html": "html",
+    ".md": "markdown",
+    ".txt": "plain",
+    ".xml": "xml",
+}
+
+# Upper bound on threads reading and encoding attachments concurrently.
+_MAX_ATTACHMENT_WORKERS = 8
+
+# SMTP is sequential per connection, so a single worker serializes all sends.
+# The executor only starts its thread on the first submit.
+_MAIL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+
+# Port for SMTP over implicit TLS (RFC 8314), which skips the STARTTLS exchange.
+_SMTPS_PORT = 465
+
+
+@lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by all SMTP connections.
+
+    Built on first use so the CA store is loaded once per process rather than
+    once per connection.
+    """
+    return ssl.create_default_context()
+
+
+@lru_cache(maxsize=None)
+def _utf8_8bit_charset() -> Charset:
+    """Return a UTF-8 charset whose bodies are sent unencoded (8bit)."""
+    from email.charset import Charset
+
+    charset = Charset("utf-8")
+    charset.body_encoding = None
+    return charset
+
+
+def _encode_file_b64(path: Path, chunk_size: int = _B64_CHUNK_BYTES) -> str:
+    """Base64-encode a file in fixed-size chunks, wrapped at 76 characters.
+
+    Args:
+        path: File to encode
+        chunk_size: Bytes read per iteration; must be a multiple of 57
+
+    Returns:
+        The encoded body, ready to use as a MIME payload
+    """
+    line_chars = _B64_LINE_BYTES * 4 // 3
+    pieces = []
+    with path.open("rb") as file_handle:
+        while chunk := file_handle.read(chunk_size):
+            encoded = binascii.b2a_base64(chunk, newline=False)
+            pieces.extend(
+                encoded[start:start + line_chars] for start in range(0, len(encoded), line_chars)
+            )
+    return b"\n".join(pieces).decode("ascii") + ("\n" if pieces else "")
+
+
+def _build_attachment(path: Path) -> MIMEBase:
+    """Build the MIME part for one attachment.
+
+    UTF-8 text reports (CSV, HTML, ...) become 8bit ``text/*`` parts; anything
+    else, including text in another encoding, is base64-encoded.
+
+    Args:
+        path: File to attach
+
+    Returns:
+        The MIME part, with its ``Content-Disposition`` set
+    """
+    # email.mime is only needed when a message is built; import it here.
+    from email.mime.base import MIMEBase
+    from email.mime.text import MIMEText
+
+    subtype = _TEXT_SUBTYPES.get(path.suffix.lower())
+    part: MIMEBase | None = None
+    if subtype is not None:
+        try:
+            part = MIMEText(path.read_text(encoding="utf-8"), subtype, _utf8_8bit_charset())
+        except UnicodeDecodeError:
+            part = None
+    if part is None:
+        part = MIMEBase("application", "octet-stream")
+        part.set_payload(_encode_file_b64(path))
+        part["Content-Transfer-Encoding"] = "base64"
+    part.add_header("Content-Disposition", f"attachment; filename={path.name}")
+    return part
+
+
+def _load_attachment(attachment: Path | str) -> MIMEBase | None:
+    """Build the MIME part for ``attachment``, or ``None`` if it cannot be read.
+
+    Failures are logged rather than raised so one bad file does not stop the
+    email from going out.
+    """
+    path = Path(attachment).expanduser()
+    if not path.exists():
+        logger.warning("Attachment not found: %s", path)
+        return None
+    try:
+        part = _build_attachment(path)
+    except Exception as e:
+        logger.error("Failed to attach %s: %s", path, e)
+        return None
+    logger.debug("Added attachment: %s", path.name)
+    return part
+
+
+def _load_attachments(attachments: Iterable[Path | str]) -> list[MIMEBase]:
+    """Read and encode attachments concurrently, keeping their order.
+
+    File reads release the GIL, so reports on slow or network storage are
+    fetched in parallel; a single attachment is handled inline.
+    """
+    attachments = list(attachments)
+    if len(attachments) <= 1:
+        parts = [_load_attachment(attachment) for attachment in attachments]
+    else:
+        workers = min(_MAX_ATTACHMENT_WORKERS, len(attachments))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="attach") as executor:
+            parts = list(executor.map(_load_attachment, attachments))
+    return [part for part in parts if part is not None]
+
+
+class SmtpSession:
+    """An authenticated SMTP connection that can send several messages.
+
+    Opening the session does the TCP connect, TLS negotiation and login once;
+    every ``send`` then reuses that connection. Port 465 uses implicit TLS,
+    any other port STARTTLS. A connection dropped by the server is
+    re-established once before giving up.
+
+    Example:
+        with SmtpSession(email_config) as session:
+            send_reports(session, subject, html_body, attachments)
+    """
+
+    def __init__(self, email_config: EmailConfig, timeout: float = 30) -> None:
+        self.email_config = email_config
+        self.timeout = timeout
+        self._stack: ExitStack | None = None
+        self._server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> "SmtpSession":
+        self._connect()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _connect(self) -> None:
+        config = self.email_config
+        logger.info("Connecting to SMTP server: %s:%s", config.smtp_server, config.smtp_port)
+        stack = ExitStack()
+        try:
+            if config.smtp_port == _SMTPS_PORT:
+                server = stack.enter_context(
+                    smtplib.SMTP_SSL(
+                        config.smtp_server,
+                        config.smtp_port,
+                        timeout=self.timeout,
+                        context=_ssl_context(),
+                    )
+                )
+            else:
+                server = stack.enter_context(
+                    smtplib.SMTP(config.smtp_server, config.smtp_port, timeout=self.timeout)
+                )
+                server.starttls(context=_ssl_context())
+            server.login(config.sender_email, config.sender_password)
+        except BaseException:
+            stack.close()
+            raise
+        self._stack, self._server = stack, server
+
+    def close(self) -> None:
+        """Quit the SMTP connection if it is open."""
+        stack, self._stack, self._server = self._stack, None, None
+        if stack is not None:
+            try:
+                stack.close()
+            except smtplib.SMTPServerDisconnected:
+                pass
+
+    def send(self, message: Message) -> None:
+        """Send ``message``, reconnecting once if the server dropped the connection.
+
+        Args:
+            message: Fully built email message
+        """
+        if self._server is None:
+            self._connect()
+        try:
+            self._server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            logger.warning("SMTP connection was closed by the server; reconnecting")
+            self.close()
+            self._connect()
+            self._server.send_message(message)
+
 
 def send_reports(
-    email_config: EmailConfig,
+    email_config: EmailConfig | SmtpSession,
     subject: str,
     html_body: str,
     attachments: Iterable[Path],
@@ -25,7 +240,8 @@ def send_reports(
     """Send email with attachments and comprehensive error handling.
     
     Args:
-        email_config: Email configuration with SMTP settings
+        email_config: Email configuration with SMTP settings, or an open
+            ``SmtpSession`` to send through an existing connection
         subject: Email subject line
         html_body: HTML content of the email
         attachments: Iterable of file paths to attach
@@ -35,6 +251,13 @@ def send_reports(
         ConnectionError: If SMTP connection fails
         smtplib.SMTPException: If email sending fails
     """
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    session = email_config if isinstance(email_config, SmtpSession) else None
+    if session is not None:
+        email_config = session.email_config
+
     try:
         # Validate email configuration
         if not email_config.sender_email or not email_config.sender_password:
@@ -43,7 +266,7 @@ def send_reports(
         if not email_config.recipient_emails:
             raise ValueError("No recipient emails configured")
         
-        logger.info(f"Preparing email to {len(email_config.recipient_emails)} recipients")
+        logger.info("Preparing email to %s recipients", len(email_config.recipient_emails))
         
         # Create message
         message = MIMEMultipart()
@@ -53,48 +276,59 @@ def send_reports(
         message.attach(MIMEText(html_body, "html"))
 
         # Add attachments
-        attachment_count = 0
-        for attachment in attachments:
-            path = Path(attachment).expanduser()
-            if not path.exists():
-                logger.warning(f"Attachment not found: {path}")
-                continue
-            try:
-                with path.open("rb") as file_handle:
-                    part = MIMEBase("application", "octet-stream")
-                    part.set_payload(file_handle.read())
-                    encoders.encode_base64(part)
-                    part.add_header("Content-Disposition", f"attachment; filename={path.name}")
-                    message.attach(part)
-                    attachment_count += 1
-                    logger.debug(f"Added attachment: {path.name}")
-            except Exception as e:
-                logger.error(f"Failed to attach {path}: {e}")
-                continue
-        
-        logger.info(f"Email prepared with {attachment_count} attachments")
+        parts = _load_attachments(attachments)
+        for part in parts:
+            message.attach(part)
+
+        logger.info("Email prepared with %s attachments", len(parts))
 
         # Send email with timeout and retry logic
         try:
-            with smtplib.SMTP(email_config.smtp_server, email_config.smtp_port, timeout=30) as server:
-                logger.info(f"Connecting to SMTP server: {email_config.smtp_server}:{email_config.smtp_port}")
-                server.starttls()
-                server.login(email_config.sender_email, email_config.sender_password)
-                server.send_message(message)
-                logger.info("Email sent successfully")
+            if session is not None:
+                session.send(message)
+            else:
+                with SmtpSession(email_config) as one_shot:
+                    one_shot.send(message)
+            logger.info("Email sent successfully")
         except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP authentication failed: {e}")
+            logger.error("SMTP authentication failed: %s", e)
             raise ConnectionError(f"Failed to authenticate with SMTP server: {e}")
         except smtplib.SMTPConnectError as e:
-            logger.error(f"SMTP connection failed: {e}")
+            logger.error("SMTP connection failed: %s", e)
             raise ConnectionError(f"Failed to connect to SMTP server: {e}")
         except smtplib.SMTPException as e:
-            logger.error(f"SMTP error occurred: {e}")
+            logger.error("SMTP error occurred: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error sending email: {e}")
+            logger.error("Unexpected error sending email: %s", e)
             raise ConnectionError(f"Failed to send email: {e}")
             
     except Exception as e:
-        logger.error(f"Email sending failed: {e}")
+        logger.error("Email sending failed: %s", e)
         raise
+
+
+def send_reports_async(
+    email_config: EmailConfig | SmtpSession,
+    subject: str,
+    html_body: str,
+    attachments: Iterable[Path],
+) -> "Future[None]":
+    """Queue ``send_reports`` on the background mail worker.
+
+    The caller can keep working while the SMTP handshake and transfer run;
+    call ``result(timeout=...)`` on the returned future before exiting to
+    wait for delivery and re-raise any sending error.
+
+    Args:
+        email_config: Email configuration with SMTP settings, or an open
+            ``SmtpSession``; a session must not be used elsewhere meanwhile
+        subject: Email subject line
+        html_body: HTML content of the email
+        attachments: Iterable of file paths to attach
+
+    Returns:
+        Future resolving once the email has been sent
+    """
+    # Materialize now so later changes to the caller's list do not race the send.
+    return _MAIL_POOL.submit(send_reports, email_config, subject, html_body, list(attachments))
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Mapping, Sequence
 
 import numpy as np
@@ -10,10 +11,11 @@ import pandas as pd
 
 from .config import AppConfig
 from .constants import (
-    ADMIN_EXPENSES_PATTERN,
-    OTHER_EXPENSES_PATTERN,
-    SALES_COSTS_PATTERN,
-    PRODUCTION_COSTS_PATTERN,
+    ADMIN_EXPENSES_PREFIXES,
+    OTHER_EXPENSES_PREFIXES,
+    SALES_COSTS_PREFIXES,
+    PRODUCTION_COSTS_PREFIXES,
+    DETAIL_ACCOUNT_DIGITS,
     DEPRECIATION_PATTERNS,
     INTEREST_PATTERNS,
     SALARY_PATTERNS,
@@ -27,7 +29,42 @@ from .constants import (
     COST_DESCRIPTION,
     PROFIT_DESCRIPTION,
 )
-from .data_loader import FinancialData
+from .data_loader import FinancialData, open_workbook, read_balance_sheets
+
+
+# Expense categories by the two-digit prefix of detail account codes (the
+# vectorized form of the *_EXPENSES_PATTERN / *_COSTS_PATTERN constants).
+_EXPENSE_CATEGORY_PREFIXES = {
+    "gastos_admin": ADMIN_EXPENSES_PREFIXES,
+    "gastos_otros": OTHER_EXPENSES_PREFIXES,
+    "costos_venta": SALES_COSTS_PREFIXES,
+    "costos_prod": PRODUCTION_COSTS_PREFIXES,
+}
+# Category id per two-digit prefix, -1 for none. The extra last slot is what
+# the -1 "not a detail account" prefix indexes, so it must stay -1.
+_CATEGORY_BY_PREFIX = np.full(101, -1, dtype=np.int8)
+for _category_id, _prefixes in enumerate(_EXPENSE_CATEGORY_PREFIXES.values()):
+    _CATEGORY_BY_PREFIX[list(_prefixes)] = _category_id
+del _category_id, _prefixes
+_SALARY_RE = re.compile("|".join(SALARY_PATTERNS), re.IGNORECASE)
+_SEVERANCE_RE = re.compile("|".join(SEVERANCE_PATTERNS), re.IGNORECASE)
+_DEPRECIATION_RE = re.compile("|".join(DEPRECIATION_PATTERNS), re.IGNORECASE)
+_INTEREST_RE = re.compile("|".join(INTEREST_PATTERNS), re.IGNORECASE)
+_RESULTADO_DESCRIPTIONS = {
+    "costos": COST_DESCRIPTION,
+    "utilidad": PROFIT_DESCRIPTION,
+    "ingresos": INCOME_DESCRIPTION,
+}
+
+
+@dataclass(frozen=True)
+class BudgetTotals:
+    """Headline budget execution figures for the current month."""
+
+    ingresos_actual: float = 0.0
+    gastos_actual: float = 0.0
+    pct_ingresos: float = 0.0
+    pct_gastos: float = 0.0
 
 
 @dataclass
@@ -38,6 +75,7 @@ class BudgetResult:
     gastos_otros: float
     costos_venta: float
     costos_produccion: float
+    totals: BudgetTotals = field(default_factory=BudgetTotals)
 
 
 @dataclass
@@ -47,34 +85,56 @@ class KPIResult:
 
 
 def consolidate_balance(data: FinancialData, config: AppConfig) -> pd.DataFrame:
+    available = set(data.sheet_names)
+    sheet_months = {
+        f"BALANCE {month}": month
+        for month in config.month_order
+        if f"BALANCE {month}" in available
+    }
+    if not sheet_months or data.source_path is None:
+        raise ValueError("No balance sheets were processed")
+
+    # One batched read through the workbook already opened by the loader; the
+    # frames come back with the balance column names already applied.
+    frames = read_balance_sheets(open_workbook(data.source_path), list(sheet_months))
+
     sheets = []
-    for month in config.month_order:
-        sheet_name = f"BALANCE {month}"
-        if sheet_name not in data.workbook.sheet_names:
-            continue
-        df_month = pd.read_excel(data.workbook, sheet_name=sheet_name, skiprows=4)
+    for sheet_name, month in sheet_months.items():
+        df_month = frames[sheet_name]
         if df_month.empty:
             continue
-        df_month.columns = (
-            [
-                "Nivel",
-                "Código cuenta contable",
-                "Nombre cuenta contable",
-                "Saldo inicial",
-                "Movimiento débito",
-                "Movimiento crédito",
-                "Saldo final",
-            ]
-            + [f"Extra_{i}" for i in range(len(df_month.columns) - 7)]
-        )[: len(df_month.columns)]
-        df_month["Month"] = month
+        # Keep only the class rows before concatenating, so concat copies little.
+        df_month = df_month[df_month["Nivel"] == "Clase"]
+        df_month.insert(len(df_month.columns), "Month", month)
         sheets.append(df_month)
 
     if not sheets:
         raise ValueError("No balance sheets were processed")
 
-    consolidated = pd.concat(sheets, ignore_index=True)
-    return consolidated[consolidated["Nivel"] == "Clase"].copy()
+    return pd.concat(sheets, ignore_index=True)
+
+
+def _resultado_rows(resultado: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Locate the income statement rows used for costs, profit and income.
+
+    Each distinct description is lowercased and tested once with a plain
+    substring check; row codes from ``pd.factorize`` map the hits back to rows.
+
+    Args:
+        resultado: Normalized income statement DataFrame
+
+    Returns:
+        Row positions keyed ``costos``, ``utilidad`` and ``ingresos``
+    """
+    codes, uniques = pd.factorize(resultado["Descripcion"])
+    lowered = [value.lower() if isinstance(value, str) else "" for value in uniques]
+    rows = {}
+    for name, description in _RESULTADO_DESCRIPTIONS.items():
+        needle = description.lower()
+        # The extra trailing False is picked by code -1 (missing description).
+        hits = np.array([needle in value for value in lowered] + [False])
+        rows[name] = np.flatnonzero(hits[codes])
+    return rows
 
 
 def _calculate_income(data: FinancialData) -> float:
@@ -86,51 +146,155 @@ def _calculate_income(data: FinancialData) -> float:
     Returns:
         Actual income amount
     """
-    ingresos_series = data.resultado[
-        data.resultado["Descripcion"].str.contains(INCOME_DESCRIPTION, case=False, na=False)
-    ][data.resultado_current_col]
-    return abs(float(ingresos_series.iloc[0])) if not ingresos_series.empty else 0.0
+    income_rows = data.cached("resultado_rows", data.resultado, _resultado_rows)["ingresos"]
+    if not len(income_rows):
+        return 0.0
+    return abs(float(data.resultado[data.resultado_current_col].iloc[income_rows[0]]))
 
 
-def _categorize_expenses(data: FinancialData) -> tuple[dict[str, float], dict[str, float]]:
-    """Categorize expenses into different types.
-    
+def _detail_code_prefixes(codes: pd.Series) -> np.ndarray:
+    """Return the two-digit prefix of each detail account code, or -1.
+
+    A detail account code starts with at least ``DETAIL_ACCOUNT_DIGITS`` ASCII
+    digits; group rows such as ``51`` or ``5105`` are not detail accounts.
+    The codes are read as fixed-width UCS-4 code points, so the check is a
+    handful of array comparisons instead of a regex match per row.
+
     Args:
-        data: Financial data containing ERI information
-        
+        codes: Account code column
+
+    Returns:
+        Integer array with the prefix (e.g. 51) or -1 for every row
+    """
+    text = codes.to_numpy(dtype=object, na_value="").astype(str)
+    if text.dtype.itemsize // 4 < DETAIL_ACCOUNT_DIGITS:
+        return np.full(len(text), -1)
+    points = text.view(np.uint32).reshape(len(text), -1)[:, :DETAIL_ACCOUNT_DIGITS]
+    # Unsigned wrap-around sends anything below "0" above 9 as well.
+    digits = points - np.uint32(ord("0"))
+    is_detail = (digits <= 9).all(axis=1)
+    return np.where(is_detail, digits[:, 0].astype(np.int64) * 10 + digits[:, 1], -1)
+
+
+def expense_row_mask(data: FinancialData) -> np.ndarray:
+    """Return a boolean mask of the ERI rows in any expense category.
+
+    Reuses the expense categories memoized on ``data``.
+
+    Args:
+        data: Financial data containing the ERI
+
+    Returns:
+        Boolean array aligned with ``data.eri`` rows
+    """
+    return data.cached("expense_categories", data.eri, _expense_categories) >= 0
+
+
+def _any_mask(masks: Mapping[str, pd.Series]) -> np.ndarray:
+    """Return the row-wise union of ``masks`` as a boolean array."""
+    return np.stack(
+        [mask.to_numpy(dtype=bool, na_value=False) for mask in masks.values()]
+    ).any(axis=0)
+
+
+def _expense_categories(eri: pd.DataFrame) -> np.ndarray:
+    """Return the expense category id of every ERI row, -1 for none.
+
+    Ids follow the order of ``_EXPENSE_CATEGORY_PREFIXES``.
+
+    Args:
+        eri: Normalized ERI DataFrame
+
+    Returns:
+        ``int8`` array aligned with ``eri`` rows
+    """
+    # One table lookup assigns every row its category id.
+    return _CATEGORY_BY_PREFIX[_detail_code_prefixes(eri["Codigo"])]
+
+
+def _expense_masks(eri: pd.DataFrame) -> tuple[dict[str, pd.Series], dict[str, pd.Series]]:
+    """Build the expense category masks for the ERI rows.
+
+    Args:
+        eri: Normalized ERI DataFrame
+
     Returns:
-        Tuple of (base_expenses, extra_expenses) dictionaries
+        Tuple of (base_masks, extra_masks) keyed by category name
     """
-    # Enhanced expense categorization with better mapping
+    categories = _expense_categories(eri)
     base_masks = {
-        "gastos_admin": data.eri["Codigo"].str.match(ADMIN_EXPENSES_PATTERN, na=False),
-        "gastos_otros": data.eri["Codigo"].str.match(OTHER_EXPENSES_PATTERN, na=False),
-        "costos_venta": data.eri["Codigo"].str.match(SALES_COSTS_PATTERN, na=False),
-        "costos_prod": data.eri["Codigo"].str.match(PRODUCTION_COSTS_PATTERN, na=False),
+        name: pd.Series(categories == category_id, index=eri.index, name=name)
+        for category_id, name in enumerate(_EXPENSE_CATEGORY_PREFIXES)
     }
 
     # Additional categorization for salaries and severance
-    salary_pattern = "|".join(SALARY_PATTERNS)
-    severance_pattern = "|".join(SEVERANCE_PATTERNS)
-    
-    sueldos_mask = base_masks["gastos_admin"] & data.eri["Display Name"].str.contains(salary_pattern, case=False, na=False)
-    cesantias_mask = base_masks["gastos_admin"] & data.eri["Display Name"].str.contains(severance_pattern, case=False, na=False)
     extra_masks = {
-        "sueldos": sueldos_mask,
-        "cesantias": cesantias_mask,
+        "sueldos": base_masks["gastos_admin"] & eri["Display Name"].str.contains(_SALARY_RE, na=False),
+        "cesantias": base_masks["gastos_admin"] & eri["Display Name"].str.contains(_SEVERANCE_RE, na=False),
     }
+    return base_masks, extra_masks
 
-    current_col = data.current_month_col
+
+def _masked_sums(masks: Mapping[str, pd.Series], values: pd.Series) -> dict[str, float]:
+    """Return ``abs(values[mask].sum())`` for every mask in one pass.
+
+    The masks may overlap (salaries are a subset of admin expenses), so they
+    are stacked into a boolean matrix and reduced with a single mat-vec
+    product instead of one boolean-index sum per mask.
+
+    Args:
+        masks: Boolean masks aligned with ``values``, keyed by name
+        values: Amounts to sum; missing values count as zero
+
+    Returns:
+        Absolute masked totals keyed like ``masks``
+    """
+    if not masks:
+        return {}
+    matrix = np.stack([mask.to_numpy(dtype=bool, na_value=False) for mask in masks.values()])
+    amounts = values.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    np.nan_to_num(amounts, copy=False, nan=0.0)
+    totals = matrix @ amounts
+    return {name: abs(float(total)) for name, total in zip(masks, totals)}
+
+
+def _categorize_expenses(
+    data: FinancialData,
+) -> tuple[dict[str, float], dict[str, float], dict[str, pd.Series], dict[str, pd.Series]]:
+    """Categorize expenses into different types.
+    
+    Args:
+        data: Financial data containing ERI information
+        
+    Returns:
+        Tuple of (base_expenses, extra_expenses, base_masks, extra_masks); the
+        masks are returned so callers can reuse them without re-matching
+    """
+    base_masks, extra_masks = data.cached("expense_masks", data.eri, _expense_masks)
+    categories = data.cached("expense_categories", data.eri, _expense_categories)
+    column = data.eri[data.current_month_col]
+
+    # The base categories are disjoint, so one bincount over the category ids
+    # totals all of them in a single pass; rows without a category are dropped.
+    amounts = column.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    np.nan_to_num(amounts, copy=False, nan=0.0)
+    in_category = categories >= 0
+    by_category = np.bincount(
+        categories[in_category],
+        weights=amounts[in_category],
+        minlength=len(_EXPENSE_CATEGORY_PREFIXES),
+    )
     gastos_values = {
-        name: abs(float(data.eri.loc[mask, current_col].sum()))
-        for name, mask in base_masks.items()
-    }
-    extra_values = {
-        name: abs(float(data.eri.loc[mask, current_col].sum()))
-        for name, mask in extra_masks.items()
+        name: abs(float(total)) for name, total in zip(_EXPENSE_CATEGORY_PREFIXES, by_category)
     }
+    extra_values = _masked_sums(extra_masks, column)
     
-    return gastos_values, extra_values
+    return gastos_values, extra_values, base_masks, extra_masks
+
+
+def _execution_pct(actual: float, budget: float) -> float:
+    """Return actual as a percentage of budget, or 0 when there is no budget."""
+    return (actual / budget) * 100 if budget > 0 else 0
 
 
 def _build_budget_summary(
@@ -153,16 +317,8 @@ def _build_budget_summary(
         Summary DataFrame
     """
     # Calculate budget execution percentages
-    ejecutado_ingresos_pct = (
-        (actual_ingresos / config.budgets.ingresos_mensual) * 100
-        if config.budgets.ingresos_mensual > 0
-        else 0
-    )
-    ejecutado_gastos_pct = (
-        (actual_total_gastos / config.budgets.gastos_mensual) * 100
-        if config.budgets.gastos_mensual > 0
-        else 0
-    )
+    ejecutado_ingresos_pct = _execution_pct(actual_ingresos, config.budgets.ingresos_mensual)
+    ejecutado_gastos_pct = _execution_pct(actual_total_gastos, config.budgets.gastos_mensual)
 
     # Enhanced summary with more detailed breakdown
     summary_data = [
@@ -191,7 +347,8 @@ def _build_expense_distribution(
     Args:
         data: Financial data
         base_masks: Base expense category masks
-        extra_masks: Additional expense category masks
+        extra_masks: Additional expense category masks; these are subsets of
+            ``gastos_admin`` and do not widen the selected rows
         actual_total_gastos: Total actual expenses
         
     Returns:
@@ -205,28 +362,47 @@ def _build_expense_distribution(
     previous_index = max(months.index(current_col) - 1, 0)
     previous_month = months[previous_index]
     
-    relevant_mask = np.logical_or.reduce(tuple(base_masks.values()) + tuple(extra_masks.values()))
-    distribution = data.eri.loc[relevant_mask, ["Display Name"] + months].copy()
-    distribution.set_index("Display Name", inplace=True)
-    distribution[months] = distribution[months].abs()
-    distribution["Average Jan-Current"] = distribution[months].mean(axis=1)
-    distribution[f"% Diff vs {previous_month.split()[0]}"] = (
-        (
-            distribution[current_col] - distribution[previous_month]
-        )
-        / distribution[previous_month].replace(0, np.nan)
-    ).fillna(0) * 100
-    distribution["% vs Average"] = (
-        (
-            distribution[current_col] - distribution["Average Jan-Current"]
-        )
-        / distribution["Average Jan-Current"].replace(0, np.nan)
-    ).fillna(0) * 100
-    distribution[f"% del Total {data.current_month}"] = (
-        distribution[current_col] / actual_total_gastos * 100
+    # Extra masks are subsets of gastos_admin, so the base masks cover the union.
+    relevant_mask = _any_mask(base_masks)
+    # Magnitudes of the selected rows of the shared month matrix; the row
+    # selection is a copy, so abs() runs in place on it.
+    values = data.eri_month_values()[relevant_mask]
+    np.abs(values, out=values)
+    average = np.add.reduce(values, axis=1) / len(months)
+    current = values[:, months.index(current_col)]
+
+    # Derived columns are computed on the arrays and the frame is built once,
+    # as one float64 block, instead of inserting columns one at a time.
+    return pd.DataFrame(
+        np.column_stack(
+            [
+                values,
+                average,
+                _percent_change(current, values[:, previous_index]),
+                _percent_change(current, average),
+                current / actual_total_gastos * 100,
+            ]
+        ),
+        index=pd.Index(data.eri["Display Name"].to_numpy()[relevant_mask], name="Display Name"),
+        columns=months
+        + [
+            "Average Jan-Current",
+            f"% Diff vs {previous_month.split()[0]}",
+            "% vs Average",
+            f"% del Total {data.current_month}",
+        ],
     )
-    
-    return distribution
+
+
+def _percent_change(current: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Return ``(current - reference) / reference * 100``, with 0 where undefined.
+
+    Rows with a zero or missing reference (or a missing current value) yield 0.
+    """
+    result = np.zeros_like(current, dtype=np.float64)
+    np.divide(current - reference, reference, out=result, where=reference != 0)
+    np.nan_to_num(result, copy=False, nan=0.0)
+    return result * 100
 
 
 def compute_budget_execution(data: FinancialData, config: AppConfig) -> BudgetResult:
@@ -243,28 +419,13 @@ def compute_budget_execution(data: FinancialData, config: AppConfig) -> BudgetRe
     actual_ingresos = _calculate_income(data)
 
     # Categorize expenses
-    gastos_values, extra_values = _categorize_expenses(data)
+    gastos_values, extra_values, base_masks, extra_masks = _categorize_expenses(data)
     actual_total_gastos = sum(gastos_values.values())
 
     # Build summary table
     summary = _build_budget_summary(data, config, actual_ingresos, actual_total_gastos, gastos_values)
 
     # Build expense distribution analysis
-    base_masks = {
-        "gastos_admin": data.eri["Codigo"].str.match(ADMIN_EXPENSES_PATTERN, na=False),
-        "gastos_otros": data.eri["Codigo"].str.match(OTHER_EXPENSES_PATTERN, na=False),
-        "costos_venta": data.eri["Codigo"].str.match(SALES_COSTS_PATTERN, na=False),
-        "costos_prod": data.eri["Codigo"].str.match(PRODUCTION_COSTS_PATTERN, na=False),
-    }
-    
-    salary_pattern = "|".join(SALARY_PATTERNS)
-    severance_pattern = "|".join(SEVERANCE_PATTERNS)
-    
-    extra_masks = {
-        "sueldos": base_masks["gastos_admin"] & data.eri["Display Name"].str.contains(salary_pattern, case=False, na=False),
-        "cesantias": base_masks["gastos_admin"] & data.eri["Display Name"].str.contains(severance_pattern, case=False, na=False),
-    }
-    
     distribution = _build_expense_distribution(data, base_masks, extra_masks, actual_total_gastos)
 
     return BudgetResult(
@@ -274,43 +435,64 @@ def compute_budget_execution(data: FinancialData, config: AppConfig) -> BudgetRe
         gastos_otros=gastos_values["gastos_otros"],
         costos_venta=gastos_values["costos_venta"],
         costos_produccion=gastos_values["costos_prod"],
+        totals=BudgetTotals(
+            ingresos_actual=actual_ingresos,
+            gastos_actual=actual_total_gastos,
+            pct_ingresos=_execution_pct(actual_ingresos, config.budgets.ingresos_mensual),
+            pct_gastos=_execution_pct(actual_total_gastos, config.budgets.gastos_mensual),
+        ),
     )
 
 
-def _sum_for_balance(balance: pd.DataFrame, level: str, codes: Sequence[str]) -> float:
+def _balance_sums(balance: pd.DataFrame) -> pd.Series:
+    """Total ``Saldo final`` per (``Nivel``, ``Código cuenta contable``) pair."""
+    return balance.groupby(["Nivel", "Código cuenta contable"], observed=True)["Saldo final"].sum()
+
+
+def _sum_for_balance(
+    balance: pd.DataFrame,
+    level: str,
+    codes: Sequence[str],
+    sums: pd.Series | None = None,
+) -> float:
     """Sum balance sheet values for specific level and codes.
     
     Args:
         balance: Balance sheet DataFrame
         level: Account level (Clase, Grupo, etc.)
         codes: List of account codes to sum
+        sums: Precomputed ``_balance_sums(balance)``, if available
         
     Returns:
         Sum of balance values
     """
-    frame = balance[(balance["Nivel"] == level) & balance["Código cuenta contable"].isin(codes)]
-    return float(frame["Saldo final"].sum()) if not frame.empty else 0.0
+    if sums is None:
+        sums = _balance_sums(balance)
+    keys = pd.MultiIndex.from_arrays([[level] * len(codes), list(codes)])
+    return float(sums.reindex(keys).sum())
 
 
-def _get_income_statement_data(resultado: pd.DataFrame, current_col: str) -> tuple[float, float, float]:
+def _get_income_statement_data(
+    resultado: pd.DataFrame,
+    current_col: str,
+    rows: Mapping[str, np.ndarray] | None = None,
+) -> tuple[float, float, float]:
     """Extract key values from income statement.
     
     Args:
         resultado: Income statement DataFrame
         current_col: Current month column name
+        rows: Precomputed ``_resultado_rows(resultado)``, if available
         
     Returns:
         Tuple of (costs, profit, income)
     """
-    costos_series = resultado[
-        resultado["Descripcion"].str.contains(COST_DESCRIPTION, case=False, na=False)
-    ][current_col]
-    utilidad_series = resultado[
-        resultado["Descripcion"].str.contains(PROFIT_DESCRIPTION, case=False, na=False)
-    ][current_col]
-    ingresos_series = resultado[
-        resultado["Descripcion"].str.contains(INCOME_DESCRIPTION, case=False, na=False)
-    ][current_col]
+    if rows is None:
+        rows = _resultado_rows(resultado)
+    column = resultado[current_col]
+    costos_series = column.iloc[rows["costos"]]
+    utilidad_series = column.iloc[rows["utilidad"]]
+    ingresos_series = column.iloc[rows["ingresos"]]
 
     costos = abs(float(costos_series.max())) if not costos_series.empty else 0.0
     utilidad = float(utilidad_series.max()) if not utilidad_series.empty else 0.0
@@ -319,6 +501,24 @@ def _get_income_statement_data(resultado: pd.DataFrame, current_col: str) -> tup
     return costos, utilidad, ingresos
 
 
+def _ebitda_masks(eri: pd.DataFrame) -> dict[str, pd.Series]:
+    """Match the ERI rows holding depreciation and interest expenses.
+
+    Args:
+        eri: Normalized ERI DataFrame
+
+    Returns:
+        Boolean masks keyed ``depreciacion`` and ``intereses``
+    """
+    # Depreciation: account names containing "DEPRECIACION" or "AMORTIZACION";
+    # interest expenses: account names containing "INTERES"
+    names = eri["Display Name"]
+    return {
+        "depreciacion": names.str.contains(_DEPRECIATION_RE, na=False),
+        "intereses": names.str.contains(_INTEREST_RE, na=False),
+    }
+
+
 def _calculate_ebitda_components(data: FinancialData) -> tuple[float, float]:
     """Calculate depreciation and interest for EBITDA calculation.
     
@@ -328,21 +528,21 @@ def _calculate_ebitda_components(data: FinancialData) -> tuple[float, float]:
     Returns:
         Tuple of (depreciation, interest)
     """
-    # Depreciation: filter by account name containing "DEPRECIACION" or "AMORTIZACION"
-    depreciation_pattern = "|".join(DEPRECIATION_PATTERNS)
-    depreciacion_mask = data.eri["Display Name"].str.contains(
-        depreciation_pattern, case=False, na=False
-    )
-    depreciacion = abs(float(data.eri.loc[depreciacion_mask, data.current_month_col].sum()))
-    
-    # Interest expenses: filter by account name containing "INTERES"
-    interest_pattern = "|".join(INTEREST_PATTERNS)
-    intereses_mask = data.eri["Display Name"].str.contains(
-        interest_pattern, case=False, na=False
-    )
-    intereses = abs(float(data.eri.loc[intereses_mask, data.current_month_col].sum()))
-    
-    return depreciacion, intereses
+    masks = data.cached("ebitda_masks", data.eri, _ebitda_masks)
+    totals = _masked_sums(masks, data.eri[data.current_month_col])
+    return totals["depreciacion"], totals["intereses"]
+
+
+_RATIO_NAMES = (
+    "Current Ratio",
+    "Quick Ratio",
+    "Margen Bruto %",
+    "Margen Neto %",
+    "ROE %",
+    "Deuda/Patrimonio",
+    "Rotación Inventarios",
+)
+_RATIO_MULTIPLIERS = np.array([1.0, 1.0, 100.0, 100.0, 100.0, 1.0, 1.0])
 
 
 def _calculate_financial_ratios(
@@ -368,34 +568,38 @@ def _calculate_financial_ratios(
     Returns:
         Dictionary of calculated ratios
     """
-    # Liquidity ratios
-    current_ratio = current_assets / current_liabilities if current_liabilities > 0 else 0.0
-    quick_ratio = (
-        (current_assets - inventories) / current_liabilities if current_liabilities > 0 else 0.0
+    # Liquidity, profitability, leverage and activity ratios, in _RATIO_NAMES order.
+    numerators = np.array(
+        [
+            current_assets,
+            current_assets - inventories,
+            ingresos - costos,
+            utilidad,
+            utilidad,
+            current_liabilities,
+            costos,
+        ],
+        dtype=np.float64,
     )
-    
-    # Profitability ratios
-    margen_bruto = (
-        ((ingresos - costos) / ingresos) * 100 if ingresos > 0 else 0.0
+    denominators = np.array(
+        [
+            current_liabilities,
+            current_liabilities,
+            ingresos,
+            ingresos,
+            equity,
+            equity,
+            inventories,
+        ],
+        dtype=np.float64,
     )
-    margen_neto = (utilidad / ingresos * 100) if ingresos > 0 else 0.0
-    roe = (utilidad / equity * 100) if equity > 0 else 0.0
-    
-    # Leverage ratios
-    deuda_patrimonio = current_liabilities / equity if equity > 0 else 0.0
-    
-    # Activity ratios
-    rotacion_inventarios = costos / inventories if inventories > 0 else 0.0
-    
-    return {
-        "Current Ratio": round(current_ratio, 2),
-        "Quick Ratio": round(quick_ratio, 2),
-        "Margen Bruto %": round(margen_bruto, 2),
-        "Margen Neto %": round(margen_neto, 2),
-        "ROE %": round(roe, 2),
-        "Deuda/Patrimonio": round(deuda_patrimonio, 2),
-        "Rotación Inventarios": round(rotacion_inventarios, 2),
-    }
+    # Non-positive (or missing) denominators yield 0 instead of a branch per ratio.
+    ratios = np.divide(
+        numerators, denominators, out=np.zeros_like(numerators), where=denominators > 0
+    )
+    ratios *= _RATIO_MULTIPLIERS
+
+    return {name: round(float(value), 2) for name, value in zip(_RATIO_NAMES, ratios)}
 
 
 def compute_kpis(data: FinancialData, budget: BudgetResult) -> KPIResult:
@@ -412,14 +616,21 @@ def compute_kpis(data: FinancialData, budget: BudgetResult) -> KPIResult:
     resultado = data.resultado
 
     # Get assets, liabilities, and equity from Clase level
-    total_assets = _sum_for_balance(balance, "Clase", [ASSET_CLASS_CODE])
-    current_assets = _sum_for_balance(balance, "Grupo", CURRENT_ASSET_GROUPS)
-    inventories = _sum_for_balance(balance, "Grupo", [INVENTORY_GROUP_CODE])
-    current_liabilities = abs(_sum_for_balance(balance, "Clase", [LIABILITY_CLASS_CODE]))
-    equity = abs(_sum_for_balance(balance, "Clase", [EQUITY_CLASS_CODE])) or max(total_assets - current_liabilities, 0)
+    sums = data.cached("balance_sums", balance, _balance_sums)
+    total_assets = _sum_for_balance(balance, "Clase", [ASSET_CLASS_CODE], sums)
+    current_assets = _sum_for_balance(balance, "Grupo", CURRENT_ASSET_GROUPS, sums)
+    inventories = _sum_for_balance(balance, "Grupo", [INVENTORY_GROUP_CODE], sums)
+    current_liabilities = abs(_sum_for_balance(balance, "Clase", [LIABILITY_CLASS_CODE], sums))
+    equity = abs(_sum_for_balance(balance, "Clase", [EQUITY_CLASS_CODE], sums)) or max(
+        total_assets - current_liabilities, 0
+    )
 
     # Get income statement data
-    costos, utilidad, ingresos = _get_income_statement_data(resultado, data.resultado_current_col)
+    costos, utilidad, ingresos = _get_income_statement_data(
+        resultado,
+        data.resultado_current_col,
+        rows=data.cached("resultado_rows", resultado, _resultado_rows),
+    )
 
     # Calculate EBITDA components
     depreciacion, intereses = _calculate_ebitda_components(data)
@@ -3,105 +3,168 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Sequence
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from docx import Document
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 
 from .config import AppConfig
 from .data_loader import FinancialData
-from .processing import BudgetResult, KPIResult
+from .processing import BudgetResult, KPIResult, expense_row_mask
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+# Charts are embedded in the DOCX report and email; 150 dpi is plenty there
+# and rasterizes a quarter of the pixels of 300 dpi.
+_CHART_DPI = 150
+
+
+def _new_chart(width: float, height: float, figure: Figure | None = None) -> Figure:
+    """Return a figure with an Agg canvas, independent of pyplot.
+
+    A fresh figure is used per chart unless the caller supplies one:
+    ``Figure.clear()`` keeps the subplot parameters set by ``tight_layout``,
+    so a reused figure would start from the previous chart's layout.
+    """
+    if figure is None:
+        # matplotlib is only needed once a chart is drawn; import it here.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        FigureCanvasAgg(figure)
+    figure.set_size_inches(width, height)
+    return figure
+
+
+def _save_chart(figure: Figure, save_path: Path) -> Path:
+    figure.tight_layout()
+    figure.savefig(save_path, dpi=_CHART_DPI)
+    return save_path
 
 
 def _build_filename(prefix: str, data: FinancialData, suffix: str) -> Path:
     return Path.home() / "Downloads" / f"{prefix}_{data.current_month.lower()}_2025{suffix}"
 
 
+# Same header look as DataFrame.to_excel.
+_HEADER_FONT = Font(bold=True)
+_HEADER_BORDER = Border(*(Side(style="thin"),) * 4)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+
+def _write_workbook(output_path: Path, sheets: Mapping[str, pd.DataFrame]) -> Path:
+    """Write each frame to its own sheet, without the index.
+
+    Uses openpyxl's write-only mode: rows are streamed to the file as they
+    are appended instead of being held as cell objects for the whole
+    workbook, so peak memory does not grow with the frame sizes. Each column
+    is converted to plain Python values once, with missing values written as
+    empty cells.
+    """
+    workbook = Workbook(write_only=True)
+    for sheet_name, frame in sheets.items():
+        worksheet = workbook.create_sheet(sheet_name)
+        header = []
+        for name in frame.columns:
+            cell = WriteOnlyCell(worksheet, value=name)
+            cell.font = _HEADER_FONT
+            cell.border = _HEADER_BORDER
+            cell.alignment = _HEADER_ALIGNMENT
+            header.append(cell)
+        worksheet.append(header)
+        columns = [
+            frame.iloc[:, position].to_numpy(dtype=object, na_value=None).tolist()
+            for position in range(frame.shape[1])
+        ]
+        for row in zip(*columns):
+            worksheet.append(row)
+    workbook.save(output_path)
+    return output_path
+
+
 def save_consolidated_balance(df: pd.DataFrame, data: FinancialData) -> Path:
     output_path = _build_filename("consolidated_balance", data, ".xlsx")
-    df.to_excel(output_path, index=False)
-    return output_path
+    return _write_workbook(output_path, {"Sheet1": df})
 
 
 def save_budget_execution(budget: BudgetResult, data: FinancialData) -> Path:
     output_path = _build_filename("presupuesto_ejecutado", data, ".xlsx")
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        budget.summary.to_excel(writer, sheet_name="Ejecutado", index=False)
-        if not budget.distribution.empty:
-            budget.distribution.reset_index().to_excel(
-                writer, sheet_name="Distribución", index=False
-            )
-    return output_path
+    sheets = {"Ejecutado": budget.summary}
+    if not budget.distribution.empty:
+        sheets["Distribución"] = budget.distribution.reset_index()
+    return _write_workbook(output_path, sheets)
 
 
 def save_kpis(kpis: KPIResult, data: FinancialData) -> Path:
     output_path = _build_filename("kpis_financieros", data, ".xlsx")
-    kpis.table.to_excel(output_path, index=False)
-    return output_path
+    return _write_workbook(output_path, {"Sheet1": kpis.table})
 
 
-def generate_spending_chart(budget: BudgetResult, data: FinancialData) -> Path:
-    totals: List[float] = []
-    for month in data.months:
-        mask = data.eri["Codigo"].str.match(r"^(51|53|61|72|73)[0-9]{4,}", na=False)
-        totals.append(abs(float(data.eri.loc[mask, month].sum())))
+def generate_spending_chart(
+    budget: BudgetResult, data: FinancialData, figure: Figure | None = None
+) -> Path:
+    from matplotlib.ticker import FuncFormatter
+
+    # One column reduction over the expense rows; abs of each month's net total.
+    month_sums = np.nansum(data.eri_month_values()[expense_row_mask(data)], axis=0)
+    totals: List[float] = np.abs(month_sums).tolist()
 
-    plt.figure(figsize=(14, 8))
-    bars = plt.bar(data.months, totals, color="skyblue", edgecolor="navy", linewidth=1.2)
+    figure = _new_chart(14, 8, figure)
+    ax = figure.add_subplot()
+    bars = ax.bar(data.months, totals, color="skyblue", edgecolor="navy", linewidth=1.2)
     
-    # Add value labels on top of bars
-    for bar, total in zip(bars, totals):
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + max(totals)*0.01,
-                f'${total:,.0f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    # Add value labels on top of bars; matplotlib formats the bar heights
+    # (the totals) with one format string.
+    ax.bar_label(bars, fmt='${:,.0f}', padding=3, fontsize=9, fontweight='bold')
     
-    plt.title(f"Gastos Mensuales - Enero a {data.current_month} 2025", 
-              fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("Mes", fontsize=12, fontweight='bold')
-    plt.ylabel("Gastos Totales (COP)", fontsize=12, fontweight='bold')
-    plt.xticks(rotation=45, fontsize=10)
-    plt.yticks(fontsize=10)
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.set_title(f"Gastos Mensuales - Enero a {data.current_month} 2025", 
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel("Mes", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Gastos Totales (COP)", fontsize=12, fontweight='bold')
+    ax.tick_params(axis="x", labelrotation=45, labelsize=10)
+    ax.tick_params(axis="y", labelsize=10)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
     
     # Format y-axis to show values in millions
-    ax = plt.gca()
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1e6:.1f}M'))
+    ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x/1e6:.1f}M'))
     
-    save_path = _build_filename("monthly_spending", data, ".png")
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    return save_path
+    return _save_chart(figure, _build_filename("monthly_spending", data, ".png"))
 
 
-def generate_kpi_chart(kpis: KPIResult, data: FinancialData) -> Path:
-    plt.figure(figsize=(14, 8))
-    bars = plt.bar(kpis.table["KPI"], kpis.table.iloc[:, 1], color="teal", edgecolor="darkgreen", linewidth=1.2)
+def generate_kpi_chart(
+    kpis: KPIResult, data: FinancialData, figure: Figure | None = None
+) -> Path:
+    figure = _new_chart(14, 8, figure)
+    ax = figure.add_subplot()
+    bars = ax.bar(kpis.table["KPI"], kpis.table.iloc[:, 1], color="teal", edgecolor="darkgreen", linewidth=1.2)
     
     # Add value labels on top of bars
-    for bar, value in zip(bars, kpis.table.iloc[:, 1]):
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + max(kpis.table.iloc[:, 1])*0.01,
-                f'{value:.2f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    ax.bar_label(bars, fmt='{:.2f}', padding=3, fontsize=9, fontweight='bold')
     
-    plt.title(f"KPIs Financieros - {data.current_month} 2025", 
-              fontsize=16, fontweight='bold', pad=20)
-    plt.xlabel("KPI", fontsize=12, fontweight='bold')
-    plt.ylabel("Valor", fontsize=12, fontweight='bold')
-    plt.xticks(rotation=45, ha="right", fontsize=10)
-    plt.yticks(fontsize=10)
-    plt.grid(axis="y", linestyle="--", alpha=0.7)
+    ax.set_title(f"KPIs Financieros - {data.current_month} 2025", 
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_xlabel("KPI", fontsize=12, fontweight='bold')
+    ax.set_ylabel("Valor", fontsize=12, fontweight='bold')
+    ax.tick_params(axis="x", labelrotation=45, labelsize=10)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    ax.tick_params(axis="y", labelsize=10)
+    ax.grid(axis="y", linestyle="--", alpha=0.7)
     
-    save_path = _build_filename("kpi_dashboard", data, ".png")
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    return save_path
+    return _save_chart(figure, _build_filename("kpi_dashboard", data, ".png"))
 
 
-def generate_distribution_pie(budget: BudgetResult, data: FinancialData) -> Path | None:
+def generate_distribution_pie(
+    budget: BudgetResult, data: FinancialData, figure: Figure | None = None
+) -> Path | None:
+    from matplotlib import colormaps
+
     if budget.distribution.empty:
         return None
 
@@ -112,9 +175,10 @@ def generate_distribution_pie(budget: BudgetResult, data: FinancialData) -> Path
     if remaining:
         top_values.loc["Otros"] = remaining
 
-    plt.figure(figsize=(14, 10))
-    colors = plt.cm.Set3(np.linspace(0, 1, len(top_values)))
-    wedges, texts, autotexts = plt.pie(
+    figure = _new_chart(14, 10, figure)
+    ax = figure.add_subplot()
+    colors = colormaps["Set3"](np.linspace(0, 1, len(top_values)))
+    wedges, texts, autotexts = ax.pie(
         top_values.values,
         labels=top_values.index,
         autopct="%1.1f%%",
@@ -127,31 +191,29 @@ def generate_distribution_pie(budget: BudgetResult, data: FinancialData) -> Path
         autotext.set_fontweight("bold")
         autotext.set_fontsize(9)
 
-    plt.title(f"Distribución de Gastos - {data.current_month} 2025", 
-              fontsize=18, fontweight="bold", pad=20)
-    plt.axis("equal")
+    ax.set_title(f"Distribución de Gastos - {data.current_month} 2025", 
+                 fontsize=18, fontweight="bold", pad=20)
+    ax.axis("equal")
 
     # Enhanced legend with better formatting
     legend_labels = [
         f"{name}: {value:.1f}%"
-        for name, value in zip(top_values.index, top_values.values)
+        for name, value in zip(top_values.index.to_numpy(), top_values.to_numpy())
     ]
-    plt.legend(wedges, legend_labels, title="Gastos", loc="center left", 
-               bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10, title_fontsize=12)
+    ax.legend(wedges, legend_labels, title="Gastos", loc="center left", 
+              bbox_to_anchor=(1, 0, 0.5, 1), fontsize=10, title_fontsize=12)
     
     # Add total expenses text
     total_expenses = budget.distribution[data.current_month_col].sum()
-    plt.figtext(0.5, 0.02, f"Total Gastos: ${total_expenses:,.0f} COP", 
+    figure.text(0.5, 0.02, f"Total Gastos: ${total_expenses:,.0f} COP", 
                 ha="center", fontsize=12, fontweight="bold")
     
-    save_path = _build_filename("distribucion_gastos_pie", data, ".png")
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    plt.close()
-    return save_path
+    return _save_chart(figure, _build_filename("distribucion_gastos_pie", data, ".png"))
 
 
-def generate_category_pie(budget: BudgetResult, data: FinancialData) -> Path | None:
+def generate_category_pie(
+    budget: BudgetResult, data: FinancialData, figure: Figure | None = None
+) -> Path | None:
     categories = {
         "Administrativos": budget.gastos_admin,
         "Otros Gastos": budget.gastos_otros,
@@ -163,8 +225,9 @@ def generate_category_pie(budget: BudgetResult, data: FinancialData) -> Path | N
     if not categories:
         return None
 
-    plt.figure(figsize=(10, 8))
-    wedges, texts, autotexts = plt.pie(
+    figure = _new_chart(10, 8, figure)
+    ax = figure.add_subplot()
+    wedges, texts, autotexts = ax.pie(
         categories.values(),
         labels=categories.keys(),
         autopct="%1.1f%%",
@@ -175,15 +238,11 @@ def generate_category_pie(budget: BudgetResult, data: FinancialData) -> Path | N
         autotext.set_color("white")
         autotext.set_fontweight("bold")
 
-    plt.title(f"Distribución por Categorías de Gastos - {data.current_month} 2025", fontsize=14, fontweight="bold")
-    plt.axis("equal")
+    ax.set_title(f"Distribución por Categorías de Gastos - {data.current_month} 2025", fontsize=14, fontweight="bold")
+    ax.axis("equal")
     total_expenses = sum(categories.values())
-    plt.figtext(0.5, 0.02, f"Total Gastos: ${total_expenses:,.0f} COP", ha="center", fontsize=12, fontweight="bold")
-    save_path = _build_filename("categorias_gastos_pie", data, ".png")
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300)
-    plt.close()
-    return save_path
+    figure.text(0.5, 0.02, f"Total Gastos: ${total_expenses:,.0f} COP", ha="center", fontsize=12, fontweight="bold")
+    return _save_chart(figure, _build_filename("categorias_gastos_pie", data, ".png"))
 
 
 def build_ai_enhanced_board_report(
@@ -205,6 +264,8 @@ def build_ai_enhanced_board_report(
     Returns:
         Path to generated report
     """
+    from docx import Document
+
     output_path = _build_filename("informe_junta_ai", data, ".docx")
     doc = Document()
     doc.add_heading(f"Informe Ejecutivo con IA - {data.current_month} 2025", 0)
@@ -219,8 +280,8 @@ def build_ai_enhanced_board_report(
         doc.add_paragraph(f"• {insight}")
 
     # Financial Performance with AI Analysis
-    ingresos = float(budget.summary.loc[0, f"Actual {data.current_month}"])
-    gastos = float(budget.summary.loc[1, f"Actual {data.current_month}"])
+    ingresos = budget.totals.ingresos_actual
+    gastos = budget.totals.gastos_actual
     ebitda = float(kpis.metrics.get("EBITDA", 0))
     utilidad_neta = float(kpis.metrics.get("Margen Neto %", 0))
     current_ratio = float(kpis.metrics.get("Current Ratio", 0))
@@ -282,13 +343,15 @@ def build_board_report(
     data: FinancialData,
     diferencia: float | None = None,
 ) -> Path:
+    from docx import Document
+
     output_path = _build_filename("informe_junta", data, ".docx")
     doc = Document()
     doc.add_heading(f"Informe para Junta Directiva - {data.current_month} 2025", 0)
 
     # Enhanced financial summary
-    ingresos = float(budget.summary.loc[0, f"Actual {data.current_month}"])
-    gastos = float(budget.summary.loc[1, f"Actual {data.current_month}"])
+    ingresos = budget.totals.ingresos_actual
+    gastos = budget.totals.gastos_actual
     ebitda = float(kpis.metrics.get("EBITDA", 0))
     utilidad_neta = float(kpis.metrics.get("Margen Neto %", 0))
     current_ratio = float(kpis.metrics.get("Current Ratio", 0))
@@ -305,8 +368,8 @@ def build_board_report(
 
     # Budget execution analysis
     doc.add_heading("Análisis de Ejecución Presupuestaria", level=1)
-    ejecutado_ingresos = float(budget.summary.loc[0, "% Ejecutado"])
-    ejecutado_gastos = float(budget.summary.loc[1, "% Ejecutado"])
+    ejecutado_ingresos = budget.totals.pct_ingresos
+    ejecutado_gastos = budget.totals.pct_gastos
     
     doc.add_paragraph(
         f"La ejecución presupuestaria del mes muestra:\n\n"
@@ -329,10 +392,10 @@ def build_board_report(
 
     # Expense breakdown
     doc.add_heading("Desglose de Gastos por Categoría", level=1)
-    gastos_admin = float(budget.summary.loc[2, f"Actual {data.current_month}"])
-    gastos_otros = float(budget.summary.loc[3, f"Actual {data.current_month}"])
-    costos_venta = float(budget.summary.loc[4, f"Actual {data.current_month}"])
-    costos_prod = float(budget.summary.loc[5, f"Actual {data.current_month}"])
+    gastos_admin = budget.gastos_admin
+    gastos_otros = budget.gastos_otros
+    costos_venta = budget.costos_venta
+    costos_prod = budget.costos_produccion
 
     doc.add_paragraph(
         f"• Gastos Administrativos: ${gastos_admin:,.0f} COP\n"
@@ -421,16 +484,15 @@ def generate_all_figures(
     kpis: KPIResult,
     data: FinancialData,
 ) -> List[Path]:
-    figures: List[Path] = []
-    figures.append(generate_spending_chart(budget, data))
-    figures.append(generate_kpi_chart(kpis, data))
-
-    distribution_chart = generate_distribution_pie(budget, data)
-    if distribution_chart:
-        figures.append(distribution_chart)
-
-    category_chart = generate_category_pie(budget, data)
-    if category_chart:
-        figures.append(category_chart)
+    # Drawn one after another: matplotlib is not thread-safe, Agg
+    # rasterization holds the GIL, and the charts share the memoized
+    # FinancialData values.
+    charts = [
+        (generate_spending_chart, budget),
+        (generate_kpi_chart, kpis),
+        (generate_distribution_pie, budget),
+        (generate_category_pie, budget),
+    ]
+    figures = [generate(result, data) for generate, result in charts]
 
-    return figures
+    return [path for path in figures if path]
@@ -3,58 +3,79 @@
 from __future__ import annotations
 
 from pathlib import Path
+from string import Template
+from textwrap import indent
 from typing import Iterable
 
+_FILE_ICONS = {".png": "📊", ".docx": "📄"}
+_DEFAULT_FILE_ICON = "📋"
 
-def build_email_html(
-    current_month: str,
-    outputs: Iterable[Path],
-    recipient_count: int
-) -> str:
-    """Build professional HTML email template for CFO reports.
-    
-    Args:
-        current_month: Current month name
-        outputs: List of generated output files
-        recipient_count: Number of email recipients
-        
-    Returns:
-        HTML email content
-        
-    Examples:
-        >>> html = build_email_html("MARZO", [Path("report.xlsx")], 2)
-        >>> "Reporte Financiero Automatizado" in html
-        True
+# Styles shared by every email; each template adds its own rules after these.
+_BASE_CSS = """\
+body { font-family: Arial, sans-serif; margin: 20px; }
+.content { margin: 20px 0; }
+.footer { color: #7f8c8d; font-size: 12px; margin-top: 30px; }
+"""
+
+# Header, summary, file list and table styles of the two report emails.
+_REPORT_CSS = """\
+.header { background-color: #2c3e50; color: white; padding: 20px; border-radius: 5px; }
+.summary { background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 10px 0; }
+.files { background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 10px 0; }
+table { border-collapse: collapse; width: 100%; margin: 10px 0; }
+th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+th { background-color: #34495e; color: white; }
+"""
+
+_AI_CSS = """\
+.ai-summary { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 5px; margin: 10px 0; }
+.ai-insights { background-color: #e8f5e8; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #27ae60; }
+.ai-recommendations { background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #ffc107; }
+.ai-badge { background-color: #27ae60; color: white; padding: 4px 8px; border-radius: 12px; font-size: 12px; font-weight: bold; }
+"""
+
+_ERROR_CSS = """\
+.header { background-color: #e74c3c; color: white; padding: 20px; border-radius: 5px; }
+.error { background-color: #fdf2f2; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #e74c3c; }
+"""
+
+
+def _page_template(css: str, body: str) -> Template:
+    """Wrap ``body`` in the common HTML page with ``_BASE_CSS`` plus ``css``.
+
+    The page is assembled once, when the module-level templates are built;
+    each email then only substitutes its dynamic fields.
     """
-    outputs_list = list(outputs)
-    
-    html_body = f"""
+    return Template(
+        """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background-color: #2c3e50; color: white; padding: 20px; border-radius: 5px; }}
-            .content {{ margin: 20px 0; }}
-            .summary {{ background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-            .files {{ background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-            .footer {{ color: #7f8c8d; font-size: 12px; margin-top: 30px; }}
-            table {{ border-collapse: collapse; width: 100%; margin: 10px 0; }}
-            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-            th {{ background-color: #34495e; color: white; }}
-        </style>
+"""
+        + indent(_BASE_CSS + css, " " * 12)
+        + """        </style>
     </head>
     <body>
+"""
+        + body
+        + """    </body>
+    </html>
+    """
+    )
+
+
+_EMAIL_TEMPLATE = _page_template(_REPORT_CSS, """\
         <div class="header">
             <h1>📊 Reporte Financiero Automatizado</h1>
-            <h2>{current_month} 2025</h2>
+            <h2>${current_month} 2025</h2>
         </div>
         
         <div class="content">
             <div class="summary">
                 <h3>📈 Resumen Ejecutivo</h3>
-                <p>Se ha generado automáticamente el reporte financiero para el mes de <strong>{current_month} 2025</strong>.</p>
+                <p>Se ha generado automáticamente el reporte financiero para el mes de <strong>${current_month} 2025</strong>.</p>
                 <p>El sistema ha procesado los datos financieros y generado análisis detallados incluyendo:</p>
                 <ul>
                     <li>✅ Métricas agregadas (EBITDA, ratios financieros)</li>
@@ -67,107 +88,43 @@ def build_email_html(
             </div>
             
             <div class="files">
-                <h3>📁 Archivos Generados ({len(outputs_list)} archivos)</h3>
+                <h3>📁 Archivos Generados (${file_count} archivos)</h3>
                 <ul>
-    """
-    
-    # Add file list
-    for output in outputs_list:
-        file_type = "📊" if output.suffix == ".png" else "📄" if output.suffix == ".docx" else "📋"
-        html_body += f"<li>{file_type} {output.name}</li>"
-    
-    html_body += f"""
+    ${files_html}
                 </ul>
             </div>
             
             <div class="footer">
                 <p>Este reporte fue generado automáticamente por el Sistema CFO Bot v1.0</p>
-                <p>Fecha de generación: {current_month} 2025</p>
-                <p>Enviado a {recipient_count} destinatario(s)</p>
+                <p>Fecha de generación: ${current_month} 2025</p>
+                <p>Enviado a ${recipient_count} destinatario(s)</p>
             </div>
         </div>
-    </body>
-    </html>
-    """
-    
-    return html_body
+""")
 
-
-def build_ai_enhanced_email_html(
-    current_month: str,
-    outputs: Iterable[Path],
-    recipient_count: int,
-    ai_insights
-) -> str:
-    """Build AI-enhanced HTML email template for CFO reports.
-    
-    Args:
-        current_month: Current month name
-        outputs: List of generated output files
-        recipient_count: Number of email recipients
-        ai_insights: AI-generated insights
-        
-    Returns:
-        HTML email content with AI insights
-    """
-    outputs_list = list(outputs)
-    
-    html_body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background-color: #2c3e50; color: white; padding: 20px; border-radius: 5px; }}
-            .content {{ margin: 20px 0; }}
-            .ai-summary {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 5px; margin: 10px 0; }}
-            .ai-insights {{ background-color: #e8f5e8; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #27ae60; }}
-            .ai-recommendations {{ background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #ffc107; }}
-            .summary {{ background-color: #ecf0f1; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-            .files {{ background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 10px 0; }}
-            .footer {{ color: #7f8c8d; font-size: 12px; margin-top: 30px; }}
-            table {{ border-collapse: collapse; width: 100%; margin: 10px 0; }}
-            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-            th {{ background-color: #34495e; color: white; }}
-            .ai-badge {{ background-color: #27ae60; color: white; padding: 4px 8px; border-radius: 12px; font-size: 12px; font-weight: bold; }}
-        </style>
-    </head>
-    <body>
+_AI_EMAIL_TEMPLATE = _page_template(_REPORT_CSS + _AI_CSS, """\
         <div class="header">
             <h1>🤖 Reporte Financiero con IA</h1>
-            <h2>{current_month} 2025 <span class="ai-badge">POTENCIADO POR IA</span></h2>
+            <h2>${current_month} 2025 <span class="ai-badge">POTENCIADO POR IA</span></h2>
         </div>
         
         <div class="content">
             <div class="ai-summary">
                 <h3>🧠 Resumen Ejecutivo con IA</h3>
-                <p>{ai_insights.executive_summary}</p>
+                <p>${executive_summary}</p>
             </div>
             
             <div class="ai-insights">
                 <h3>💡 Insights Clave de IA</h3>
                 <ul>
-    """
-    
-    # Add AI insights
-    for insight in ai_insights.key_insights:
-        html_body += f"<li>{insight}</li>"
-    
-    html_body += f"""
+    ${insights_html}
                 </ul>
             </div>
             
             <div class="ai-recommendations">
                 <h3>🎯 Recomendaciones Estratégicas de IA</h3>
                 <ol>
-    """
-    
-    # Add AI recommendations
-    for i, recommendation in enumerate(ai_insights.recommendations, 1):
-        html_body += f"<li>{recommendation}</li>"
-    
-    html_body += f"""
+    ${recommendations_html}
                 </ol>
             </div>
             
@@ -189,80 +146,127 @@ def build_ai_enhanced_email_html(
             </div>
             
             <div class="files">
-                <h3>📁 Archivos Generados ({len(outputs_list)} archivos)</h3>
+                <h3>📁 Archivos Generados (${file_count} archivos)</h3>
                 <ul>
-    """
-    
-    # Add file list
-    for output in outputs_list:
-        file_type = "📊" if output.suffix == ".png" else "📄" if output.suffix == ".docx" else "📋"
-        ai_indicator = "🤖" if "ai" in output.name.lower() else ""
-        html_body += f"<li>{file_type} {ai_indicator} {output.name}</li>"
-    
-    html_body += f"""
+    ${files_html}
                 </ul>
             </div>
             
             <div class="footer">
                 <p>Este reporte fue generado automáticamente por el Sistema CFO Bot v2.0 con Ollama</p>
-                <p>Fecha de generación: {current_month} 2025</p>
-                <p>Enviado a {recipient_count} destinatario(s)</p>
+                <p>Fecha de generación: ${current_month} 2025</p>
+                <p>Enviado a ${recipient_count} destinatario(s)</p>
                 <p>Análisis de IA realizado con modelo Ollama</p>
             </div>
         </div>
-    </body>
-    </html>
-    """
-    
-    return html_body
+""")
 
-
-def build_error_email_html(
-    error_message: str,
-    current_month: str
-) -> str:
-    """Build HTML email template for error notifications.
-    
-    Args:
-        error_message: Error description
-        current_month: Current month name
-        
-    Returns:
-        HTML email content for error notification
-    """
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; }}
-            .header {{ background-color: #e74c3c; color: white; padding: 20px; border-radius: 5px; }}
-            .content {{ margin: 20px 0; }}
-            .error {{ background-color: #fdf2f2; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #e74c3c; }}
-            .footer {{ color: #7f8c8d; font-size: 12px; margin-top: 30px; }}
-        </style>
-    </head>
-    <body>
+_ERROR_EMAIL_TEMPLATE = _page_template(_ERROR_CSS, """\
         <div class="header">
             <h1>⚠️ Error en Generación de Reporte</h1>
-            <h2>{current_month} 2025</h2>
+            <h2>${current_month} 2025</h2>
         </div>
         
         <div class="content">
             <div class="error">
                 <h3>❌ Error Detectado</h3>
-                <p>Se ha producido un error durante la generación del reporte financiero para el mes de <strong>{current_month} 2025</strong>.</p>
+                <p>Se ha producido un error durante la generación del reporte financiero para el mes de <strong>${current_month} 2025</strong>.</p>
                 <p><strong>Detalles del error:</strong></p>
-                <pre>{error_message}</pre>
+                <pre>${error_message}</pre>
                 <p>Por favor, revise la configuración y los archivos de entrada, o contacte al administrador del sistema.</p>
             </div>
             
             <div class="footer">
                 <p>Este mensaje fue generado automáticamente por el Sistema CFO Bot v1.0</p>
-                <p>Fecha: {current_month} 2025</p>
+                <p>Fecha: ${current_month} 2025</p>
             </div>
         </div>
-    </body>
-    </html>
+""")
+
+
+def build_email_html(
+    current_month: str,
+    outputs: Iterable[Path],
+    recipient_count: int
+) -> str:
+    """Build professional HTML email template for CFO reports.
+    
+    Args:
+        current_month: Current month name
+        outputs: List of generated output files
+        recipient_count: Number of email recipients
+        
+    Returns:
+        HTML email content
+        
+    Examples:
+        >>> html = build_email_html("MARZO", [Path("report.xlsx")], 2)
+        >>> "Reporte Financiero Automatizado" in html
+        True
+    """
+    outputs_list = list(outputs)
+    files_html = "".join(
+        f"<li>{_FILE_ICONS.get(output.suffix, _DEFAULT_FILE_ICON)} {output.name}</li>"
+        for output in outputs_list
+    )
+    return _EMAIL_TEMPLATE.substitute(
+        current_month=current_month,
+        file_count=len(outputs_list),
+        files_html=files_html,
+        recipient_count=recipient_count,
+    )
+
+
+def build_ai_enhanced_email_html(
+    current_month: str,
+    outputs: Iterable[Path],
+    recipient_count: int,
+    ai_insights
+) -> str:
+    """Build AI-enhanced HTML email template for CFO reports.
+    
+    Args:
+        current_month: Current month name
+        outputs: List of generated output files
+        recipient_count: Number of email recipients
+        ai_insights: AI-generated insights
+        
+    Returns:
+        HTML email content with AI insights
+    """
+    outputs_list = list(outputs)
+    files_html = "".join(
+        f"<li>{_FILE_ICONS.get(output.suffix, _DEFAULT_FILE_ICON)} "
+        f"{'🤖' if 'ai' in output.name.lower() else ''} {output.name}</li>"
+        for output in outputs_list
+    )
+    return _AI_EMAIL_TEMPLATE.substitute(
+        current_month=current_month,
+        executive_summary=ai_insights.executive_summary,
+        insights_html="".join(f"<li>{insight}</li>" for insight in ai_insights.key_insights),
+        recommendations_html="".join(
+            f"<li>{recommendation}</li>" for recommendation in ai_insights.recommendations
+        ),
+        file_count=len(outputs_list),
+        files_html=files_html,
+        recipient_count=recipient_count,
+    )
+
+
+def build_error_email_html(
+    error_message: str,
+    current_month: str
+) -> str:
+    """Build HTML email template for error notifications.
+    
+    Args:
+        error_message: Error description
+        current_month: Current month name
+        
+    Returns:
+        HTML email content for error notification
     """
+    return _ERROR_EMAIL_TEMPLATE.substitute(
+        current_month=current_month,
+        error_message=error_message,
+    )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -10,12 +11,15 @@ import numpy as np
 import pandas as pd
 
 from .constants import (
+    ALIAS_TO_MONTH,
     ASSET_CLASS_CODE,
     EQUITY_CLASS_CODE,
     LIABILITY_CLASS_CODE,
-    MONTH_ALIASES,
 )
 
+# Path separators, dots and other characters unsafe in file names
+_FILENAME_UNSAFE_RE = re.compile(r'[./\\<>:"|?*]')
+
 
 def sanitize_filename_component(component: str) -> str:
     """Sanitize a filename component to prevent path traversal.
@@ -35,12 +39,19 @@ def sanitize_filename_component(component: str) -> str:
     if not isinstance(component, str):
         return str(component)
     
-    # Remove path traversal attempts
-    sanitized = re.sub(r'[\.\/\\]', '', component)
-    # Remove any remaining dangerous characters
-    sanitized = re.sub(r'[<>:"|?*]', '', sanitized)
-    # Limit length
-    sanitized = sanitized[:50]
+    return _sanitize_filename_text(component)
+
+
+@lru_cache(maxsize=256)
+def _sanitize_filename_text(component: str) -> str:
+    """Cached body of ``sanitize_filename_component`` for string input.
+
+    Reports reuse a handful of components (month names, file stems), so the
+    process-local cache turns repeat calls into a lookup.
+    """
+    # Drop path separators and dots (path traversal) and other unsafe
+    # characters in one pass, then limit length
+    sanitized = _FILENAME_UNSAFE_RE.sub("", component)[:50]
     
     return sanitized if sanitized else "unknown"
 
@@ -66,18 +77,31 @@ def validate_month_name(month: str) -> str:
     if not isinstance(month, str):
         raise ValueError(f"Month must be a string, got {type(month)}")
     
-    month_upper = month.upper().strip()
-    
-    # Direct match
-    if month_upper in MONTH_ALIASES:
-        return month_upper
-    
-    # Check aliases
-    for canonical, aliases in MONTH_ALIASES.items():
-        if month_upper in aliases:
-            return canonical
-    
-    raise ValueError(f"Unknown month: {month}")
+    return _canonical_month(month)
+
+
+@lru_cache(maxsize=256)
+def _canonical_month(month: str) -> str:
+    """Cached body of ``validate_month_name`` for string input.
+
+    Unknown names raise ``ValueError``, which ``lru_cache`` does not store.
+    """
+    try:
+        return ALIAS_TO_MONTH[month.upper().strip()]
+    except KeyError:
+        raise ValueError(f"Unknown month: {month}") from None
+
+
+def _class_rows(balance_df: pd.DataFrame) -> pd.DataFrame:
+    """Return the ``Clase``-level rows the balance validators look at."""
+    nivel = balance_df["Nivel"]
+    if isinstance(nivel.dtype, pd.CategoricalDtype):
+        # Loaded balances store Nivel as a categorical: compare the codes
+        categories = nivel.cat.categories
+        if "Clase" not in categories:
+            return balance_df.iloc[:0]
+        return balance_df[nivel.cat.codes.to_numpy() == categories.get_loc("Clase")]
+    return balance_df[nivel.to_numpy() == "Clase"]
 
 
 def validate_balance_equation(balance_df: pd.DataFrame) -> bool:
@@ -99,21 +123,13 @@ def validate_balance_equation(balance_df: pd.DataFrame) -> bool:
         True
     """
     try:
-        # Get totals by class
-        assets = balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == ASSET_CLASS_CODE)
-        ]["Saldo final"].sum()
-        
-        liabilities = abs(balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == LIABILITY_CLASS_CODE)
-        ]["Saldo final"].sum())
-        
-        equity = abs(balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == EQUITY_CLASS_CODE)
-        ]["Saldo final"].sum())
+        # One groupby over the class-level rows gives all three totals
+        totals = _class_rows(balance_df).groupby(
+            "Código cuenta contable", sort=False
+        )["Saldo final"].sum()
+        assets = float(totals.get(ASSET_CLASS_CODE, 0.0))
+        liabilities = abs(float(totals.get(LIABILITY_CLASS_CODE, 0.0)))
+        equity = abs(float(totals.get(EQUITY_CLASS_CODE, 0.0)))
         
         # Allow for small rounding differences
         difference = abs(assets - (liabilities + equity))
@@ -140,17 +156,23 @@ def detect_outliers(series: pd.Series, threshold: float = 3.0) -> pd.Series:
         1
     """
     if len(series) < 3:
-        return pd.Series([False] * len(series), index=series.index)
+        return pd.Series(False, index=series.index, dtype=bool)
+    
+    # Work on the float64 buffer; NaNs are skipped like Series.mean/std do
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = values[~np.isnan(values)]
+    if present.size < 2:
+        return pd.Series(False, index=series.index, dtype=bool)
     
-    # Calculate z-scores
-    mean = series.mean()
-    std = series.std()
+    mean = present.mean()
+    std = present.std(ddof=1)
     
     if std == 0:
-        return pd.Series([False] * len(series), index=series.index)
+        return pd.Series(False, index=series.index, dtype=bool)
     
-    z_scores = np.abs((series - mean) / std)
-    return z_scores > threshold
+    # |z| > threshold without dividing every element by std
+    outliers = np.abs(values - mean) > threshold * std
+    return pd.Series(outliers, index=series.index, name=series.name)
 
 
 def validate_account_signs(balance_df: pd.DataFrame) -> dict[str, list[str]]:
@@ -169,32 +191,21 @@ def validate_account_signs(balance_df: pd.DataFrame) -> dict[str, list[str]]:
     }
     
     try:
-        # Check for negative assets (should be positive)
-        negative_assets = balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == ASSET_CLASS_CODE) &
-            (balance_df["Saldo final"] < 0)
-        ]
-        if not negative_assets.empty:
-            issues["negative_assets"] = negative_assets["Nombre cuenta contable"].tolist()
+        rows = _class_rows(balance_df)
+        codes = rows["Código cuenta contable"].to_numpy()
+        negative = (rows["Saldo final"] < 0).to_numpy()
+        positive = (rows["Saldo final"] > 0).to_numpy()
         
-        # Check for positive liabilities (should be negative)
-        positive_liabilities = balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == LIABILITY_CLASS_CODE) &
-            (balance_df["Saldo final"] > 0)
-        ]
-        if not positive_liabilities.empty:
-            issues["positive_liabilities"] = positive_liabilities["Nombre cuenta contable"].tolist()
-        
-        # Check for negative equity (concerning)
-        negative_equity = balance_df[
-            (balance_df["Nivel"] == "Clase") & 
-            (balance_df["Código cuenta contable"] == EQUITY_CLASS_CODE) &
-            (balance_df["Saldo final"] < 0)
-        ]
-        if not negative_equity.empty:
-            issues["negative_equity"] = negative_equity["Nombre cuenta contable"].tolist()
+        # Assets should be positive, liabilities negative; negative equity
+        # is concerning
+        for issue, code, wrong_sign in (
+            ("negative_assets", ASSET_CLASS_CODE, negative),
+            ("positive_liabilities", LIABILITY_CLASS_CODE, positive),
+            ("negative_equity", EQUITY_CLASS_CODE, negative),
+        ):
+            flagged = (codes == code) & wrong_sign
+            if flagged.any():
+                issues[issue] = rows.loc[flagged, "Nombre cuenta contable"].tolist()
             
     except Exception as e:
         issues["validation_error"] = [str(e)]
@@ -300,6 +311,13 @@ def validate_data_types(df: pd.DataFrame, expected_types: dict[str, type]) -> li
             errors.append(f"Missing required column: {column}")
             continue
         
+        # A column whose dtype already fits needs no trial conversion
+        dtype = df[column].dtype
+        if expected_type == float and pd.api.types.is_numeric_dtype(dtype):
+            continue
+        if expected_type == str and pd.api.types.is_string_dtype(dtype):
+            continue
+        
         # Check if column can be converted to expected type
         try:
             if expected_type == float:
@@ -313,6 +331,15 @@ def validate_data_types(df: pd.DataFrame, expected_types: dict[str, type]) -> li
     return errors
 
 
+def _clean_text(value: Any) -> str:
+    """Return ``value`` as stripped text, with missing values as ``""``."""
+    if isinstance(value, str):
+        return value.strip()
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return ""
+    return str(value).strip()
+
+
 def sanitize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Sanitize DataFrame by cleaning data and handling missing values.
     
@@ -322,17 +349,26 @@ def sanitize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Sanitized DataFrame
     """
-    df_clean = df.copy()
-    
-    # Replace NaN with appropriate defaults
-    numeric_columns = df_clean.select_dtypes(include=[np.number]).columns
-    df_clean[numeric_columns] = df_clean[numeric_columns].fillna(0)
-    
-    # Clean string columns
+    # One missing-value scan serves both the empty-row filter and the fill
+    missing = df.isna().to_numpy()
+    
+    # Remove completely empty rows before any cleaning work is spent on them
+    keep = ~missing.all(axis=1)
+    df_clean = df.iloc[np.flatnonzero(keep)].copy()
+    column_has_missing = missing[keep].any(axis=0)
+    
+    # Replace NaN with appropriate defaults, only in columns that have any
+    numeric = df_clean.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+    fill_columns = df_clean.columns[numeric & column_has_missing]
+    if len(fill_columns):
+        df_clean[fill_columns] = df_clean[fill_columns].fillna(0)
+    
+    # Clean string columns: one pass per column, without the intermediate
+    # fillna/astype copies
     string_columns = df_clean.select_dtypes(include=['object']).columns
-    df_clean[string_columns] = df_clean[string_columns].fillna("").astype(str).str.strip()
-    
-    # Remove completely empty rows
-    df_clean = df_clean.dropna(how='all')
+    for column in string_columns:
+        df_clean[column] = np.array(
+            [_clean_text(value) for value in df_clean[column].to_numpy()], dtype=object
+        )
     
     return df_clean
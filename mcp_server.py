@@ -17,7 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from cfobot.cli import run_pipeline
 from cfobot.config import AppConfig, load_config
-from cfobot.data_loader import find_latest_report, load_financial_data
+from cfobot.data_loader import close_workbooks, find_latest_report, load_financial_data
 from cfobot.processing import compute_budget_execution, compute_kpis, consolidate_balance
 from cfobot.reporting import (
     build_board_report,
@@ -158,6 +158,7 @@ class CFOBotMCPServer:
             
             # Run analysis pipeline
             consolidated = consolidate_balance(self.current_data, self.config)
+            close_workbooks()
             budget = compute_budget_execution(self.current_data, self.config)
             kpis = compute_kpis(self.current_data, budget)
             
@@ -260,6 +261,7 @@ class CFOBotMCPServer:
         
         try:
             consolidated = consolidate_balance(self.current_data, self.config)
+            close_workbooks()
             
             return {
                 "success": True,
@@ -283,12 +285,13 @@ class CFOBotMCPServer:
             
             # Load the new report
             self.current_data = load_financial_data(report_path, self.config, logger)
+            close_workbooks()
             
             return {
                 "success": True,
                 "message": f"Successfully loaded report: {file_path}",
                 "month": self.current_data.current_month,
-                "sheets_loaded": len(self.current_data.workbook.sheet_names)
+                "sheets_loaded": len(self.current_data.sheet_names)
             }
         except Exception as e:
             return {"error": f"Failed to upload report: {str(e)}"}
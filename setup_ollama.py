@@ -31,7 +31,7 @@ def install_ollama():
     return True
 
 
-def pull_model(model_name="llama3.1:8b"):
+def pull_model(model_name="llama3.1:8b-instruct-q4_K_M"):
     """Pull the specified Ollama model."""
     print(f"Pulling model {model_name}...")
     try:
@@ -51,10 +51,10 @@ def setup_environment():
         with open(env_file, "w") as f:
             f.write("# CFO Bot Environment Variables\n")
             f.write("CFOBOT_OLLAMA_ENABLED=true\n")
-            f.write("CFOBOT_OLLAMA_MODEL=llama3.1:8b\n")
+            f.write("CFOBOT_OLLAMA_MODEL=llama3.1:8b-instruct-q4_K_M\n")
             f.write("CFOBOT_OLLAMA_BASE_URL=http://localhost:11434\n")
             f.write("CFOBOT_OLLAMA_TEMPERATURE=0.3\n")
-            f.write("CFOBOT_OLLAMA_MAX_TOKENS=2000\n")
+            f.write("CFOBOT_OLLAMA_MAX_TOKENS=800\n")
         print("Created .env file with Ollama configuration")
     else:
         print(".env file already exists")
@@ -74,7 +74,7 @@ def main():
         print("✅ Ollama is already installed")
     
     # Pull the default model
-    model_name = "llama3.1:8b"
+    model_name = "llama3.1:8b-instruct-q4_K_M"
     if not pull_model(model_name):
         print(f"Failed to pull model {model_name}")
         return False
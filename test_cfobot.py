@@ -74,7 +74,7 @@ def create_sample_data():
         resultado=resultado_df,
         caratula=caratula_df,
         months=['ENERO DE 2025', 'FEBRERO DE 2025', 'MARZO DE 2025'],
-        workbook=MockWorkbook()
+        sheet_names=tuple(MockWorkbook().sheet_names)
     )
     
     return data
@@ -2,7 +2,6 @@
 
 import pandas as pd
 from pathlib import Path
-from unittest.mock import Mock
 
 from cfobot.data_loader import FinancialData
 
@@ -65,12 +64,10 @@ def create_sample_caratula_data():
 
 def create_sample_financial_data():
     """Create complete sample financial data."""
-    # Mock workbook
-    mock_workbook = Mock()
-    mock_workbook.sheet_names = [
-        'BALANCE ENERO', 'BALANCE FEBRERO', 'BALANCE MARZO', 
-        'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA'
-    ]
+    sheet_names = (
+        'BALANCE ENERO', 'BALANCE FEBRERO', 'BALANCE MARZO',
+        'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA',
+    )
     
     return FinancialData(
         current_month='MARZO',
@@ -81,7 +78,7 @@ def create_sample_financial_data():
         resultado=create_sample_income_statement_data(),
         caratula=create_sample_caratula_data(),
         months=['ENERO DE 2025', 'FEBRERO DE 2025', 'MARZO DE 2025'],
-        workbook=mock_workbook
+        sheet_names=sheet_names
     )
 
 
@@ -170,8 +167,7 @@ def create_sample_email_config():
 # Test data for edge cases
 def create_empty_financial_data():
     """Create empty financial data for testing edge cases."""
-    mock_workbook = Mock()
-    mock_workbook.sheet_names = []
+    sheet_names = ()
     
     return FinancialData(
         current_month='MARZO',
@@ -182,14 +178,13 @@ def create_empty_financial_data():
         resultado=pd.DataFrame(),
         caratula=pd.DataFrame(),
         months=[],
-        workbook=mock_workbook
+        sheet_names=sheet_names
     )
 
 
 def create_malformed_financial_data():
     """Create malformed financial data for testing error handling."""
-    mock_workbook = Mock()
-    mock_workbook.sheet_names = ['BALANCE MARZO', 'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA']
+    sheet_names = ('BALANCE MARZO', 'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA')
     
     # Create data with missing required columns
     malformed_balance = pd.DataFrame({
@@ -216,5 +211,5 @@ def create_malformed_financial_data():
         resultado=malformed_resultado,
         caratula=pd.DataFrame(),
         months=[],
-        workbook=mock_workbook
+        sheet_names=sheet_names
     )
@@ -11,3 +11,26 @@ def test_load_config_defaults():
     assert isinstance(config, AppConfig)
     assert config.paths.downloads_dir.exists()
     assert config.budgets.ingresos_mensual > 0
+
+
+def test_load_config_is_cached_per_environment(monkeypatch):
+    monkeypatch.setenv("CFOBOT_OLLAMA_MODEL", "mistral:7b")
+    first = load_config()
+    assert load_config() == first
+    assert first.ollama.model == "mistral:7b"
+
+    monkeypatch.setenv("CFOBOT_OLLAMA_MODEL", "phi3:medium")
+    second = load_config()
+    assert second is not first
+    assert second.ollama.model == "phi3:medium"
+
+
+def test_load_config_returns_independent_copies():
+    first = load_config()
+    first.ollama.model = "changed"
+    first.paths.downloads_dir = Path("/nonexistent")
+
+    second = load_config()
+    assert second is not first
+    assert second.ollama.model != "changed"
+    assert second.paths.downloads_dir != Path("/nonexistent")
@@ -2,12 +2,35 @@ from pathlib import Path
 import sys
 from types import SimpleNamespace
 
+import pandas as pd
 import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from cfobot.config import DEFAULT_MONTH_ORDER
-from cfobot.data_loader import detect_current_month
+import logging
+import os
+import subprocess
+
+from cfobot.config import DEFAULT_MONTH_ORDER, AppConfig, PathConfig
+from cfobot import data_loader
+from cfobot.data_loader import (
+    BALANCE_COLUMN_NAMES,
+    FinancialData,
+    _as_string_columns,
+    _detect_month_from_filename,
+    _detect_month_from_sheet_names,
+    _normalize_eri,
+    _normalize_resultado,
+    _open_workbook,
+    _resolve_month,
+    _resolve_month_ascii,
+    _strip_accents,
+    close_workbooks,
+    detect_current_month,
+    find_latest_report,
+    open_workbook,
+    read_balance_sheets,
+)
 
 
 def test_detect_current_month_success(tmp_path: Path):
@@ -37,3 +60,247 @@ def test_detect_current_month_invalid(tmp_path: Path):
 
     with pytest.raises(ValueError):
         detect_current_month(file_path, DEFAULT_MONTH_ORDER, workbook=workbook)
+
+
+def test_strip_accents():
+    assert _strip_accents("INFORME DE MARZO") == "INFORME DE MARZO"
+    assert _strip_accents("AÑO CONTABLE ÉNERO") == "ANO CONTABLE ENERO"
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("INFORME DE SEPTIEMBRE APRU- 2025 .xls", "SEPTIEMBRE"),
+        ("Total marzo", "MARZO"),
+        ("SEP DE 2025", "SEPTIEMBRE"),
+        ("SALDOS MAYORES", None),
+        ("INFORME-ERI", None),
+        ("Enero 2025", "ENERO"),
+        ("PRESUPUESTO MARZO", "MARZO"),
+        ("ACUM ENE-MAR", None),
+        ("ENERO-DICIEMBRE", None),
+        ("Acumulado ene-mar", None),
+    ],
+)
+def test_resolve_month(label, expected):
+    assert _resolve_month(label) == expected
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["INFORME DE ABRIL APRU- 2025 .xls", "informe de abr 2025.xlsx", "INFORME DE ABRÍL 2025.xls"],
+)
+def test_resolve_month_ascii_matches_full_resolver(name):
+    assert _resolve_month_ascii(name) == _resolve_month(name) == "ABRIL"
+
+
+def test_find_latest_report_skips_hidden_and_unmatched(tmp_path: Path):
+    older = tmp_path / "INFORME DE ENERO APRU- 2025 .xlsx"
+    newer = tmp_path / "INFORME DE FEBRERO APRU- 2025 .xls"
+    hidden = tmp_path / ".~lock INFORME.xlsx"
+    other = tmp_path / "notas.txt"
+    for index, path in enumerate((older, newer, hidden, other)):
+        path.touch()
+        os.utime(path, (1_000 + index, 1_000 + index))
+    (tmp_path / "backup.xlsx.d").mkdir()
+
+    config = AppConfig(paths=PathConfig(downloads_dir=tmp_path))
+
+    assert find_latest_report(config, logging.getLogger("test")) == newer
+
+
+def test_find_latest_report_missing_directory(tmp_path: Path):
+    config = AppConfig(paths=PathConfig(downloads_dir=tmp_path / "missing"))
+
+    with pytest.raises(FileNotFoundError):
+        find_latest_report(config, logging.getLogger("test"))
+
+
+def test_open_workbook_is_cached_per_file_version(tmp_path: Path):
+    from openpyxl import Workbook
+
+    file_path = tmp_path / "report.xlsx"
+    Workbook().save(file_path)
+    stat = file_path.stat()
+
+    first = _open_workbook(str(file_path), stat.st_mtime_ns, stat.st_size)
+    assert _open_workbook(str(file_path), stat.st_mtime_ns, stat.st_size) is first
+    assert _open_workbook(str(file_path), stat.st_mtime_ns + 1, stat.st_size) is not first
+    assert open_workbook(file_path) is first
+
+
+def test_open_workbook_closes_evicted_and_released_workbooks(tmp_path: Path, monkeypatch):
+    from openpyxl import Workbook
+
+    file_path = tmp_path / "report.xlsx"
+    Workbook().save(file_path)
+    stat = file_path.stat()
+    close_workbooks()
+    closed = []
+    monkeypatch.setattr(pd.ExcelFile, "close", lambda self: closed.append(self))
+
+    versions = [
+        _open_workbook(str(file_path), stat.st_mtime_ns + offset, stat.st_size)
+        for offset in range(data_loader._WORKBOOK_CACHE_SIZE + 1)
+    ]
+    assert closed == versions[:1]
+
+    close_workbooks()
+    assert sorted(map(id, closed)) == sorted(map(id, versions))
+    assert open_workbook(file_path) is not versions[0]
+    close_workbooks()
+
+
+def test_detect_month_from_sheet_names_picks_latest():
+    sheet_names = ["CARATULA", "BALANCE MARZO", "BALANCE ENERO", "INFORME-ERI", "BALANCE FEB"]
+
+    assert _detect_month_from_sheet_names(sheet_names, DEFAULT_MONTH_ORDER) == "MARZO"
+    assert _detect_month_from_sheet_names(["CARATULA"], DEFAULT_MONTH_ORDER) is None
+
+
+def test_normalize_resultado_finds_months_in_first_rows():
+    df = pd.DataFrame({
+        "Descripcion": ["", "", "INGRESOS ORDINARIOS", "COSTO DE VENTA"],
+        "col_a": ["Total", "MARZO 2025", 10, 20],
+        "col_b": [None, "Feb", 1, 2],
+        "col_c": ["notas", "varios", 1, 1],
+    })
+
+    normalized, current = _normalize_resultado(df, "MARZO", DEFAULT_MONTH_ORDER)
+
+    assert current == "Total MARZO"
+    assert list(normalized.columns) == ["Descripcion", "Total MARZO", "Total FEBRERO"]
+    assert normalized["Total MARZO"].tolist()[:2] == [10, 20]
+
+
+def test_normalize_eri_finds_current_month_in_first_rows():
+    df = pd.DataFrame({
+        "codigo": ["", "4135", "5105"],
+        "nombre": ["", "VENTAS", "GASTOS"],
+        "col_a": ["ENERO", 100, 80],
+        "col_b": ["Febrero", 120, 90],
+        "obs": ["", "", ""],
+    })
+
+    df_eri, months, current_col = _normalize_eri(df, "FEBRERO", DEFAULT_MONTH_ORDER)
+
+    assert months == ["col_a", "col_b"]
+    assert current_col == "col_b"
+    assert df_eri["col_b"].tolist() == [0, 120, 90]
+
+
+def test_normalize_eri_skips_accumulated_range_column():
+    df = pd.DataFrame({
+        "codigo": ["4135", "5105"],
+        "nombre": ["VENTAS", "GASTOS"],
+        "ACUM ENE-MAR": [330, 250],
+        "ENERO": [100, 80],
+        "FEBRERO": [120, 90],
+        "MARZO": [110, 80],
+        "obs": ["", ""],
+    })
+
+    _, months, current_col = _normalize_eri(df, "ENERO", DEFAULT_MONTH_ORDER)
+
+    assert months == ["ENERO", "FEBRERO", "MARZO"]
+    assert current_col == "ENERO"
+
+
+def test_read_balance_sheets_keeps_balance_columns(tmp_path: Path):
+    path = tmp_path / "informe.xlsx"
+    wide = pd.DataFrame([["Clase", "1", "ACTIVO", 0, 0, 0, 500, "nota"]])
+    narrow = pd.DataFrame([["Clase", "1", "ACTIVO"]])
+    with pd.ExcelWriter(path) as writer:
+        wide.to_excel(writer, sheet_name="BALANCE MARZO", startrow=4, index=False)
+        narrow.to_excel(writer, sheet_name="BALANCE ABRIL", startrow=4, index=False)
+
+    sheets = read_balance_sheets(path, ["BALANCE MARZO"])
+    assert sheets["BALANCE MARZO"].shape == (1, 7)
+    assert list(sheets["BALANCE MARZO"].columns) == list(BALANCE_COLUMN_NAMES)
+
+    sheets = read_balance_sheets(path, ["BALANCE MARZO", "BALANCE ABRIL"])
+    assert sheets["BALANCE MARZO"].shape == (1, 7)
+    assert list(sheets["BALANCE ABRIL"].columns) == list(BALANCE_COLUMN_NAMES[:3])
+
+
+def test_as_string_columns_uses_configured_dtype(monkeypatch):
+    df = pd.DataFrame({"Codigo": ["5105", "4135"], "Valor": [1, 2]})
+
+    monkeypatch.setattr(data_loader, "STRING_DTYPE", None)
+    _as_string_columns(df, ("Codigo", "Ausente"))
+    assert df["Codigo"].dtype == object
+
+    monkeypatch.setattr(data_loader, "STRING_DTYPE", "string")
+    _as_string_columns(df, ("Codigo", "Ausente"))
+    assert df["Codigo"].dtype == "string"
+    assert df["Codigo"].str.match(r"^51", na=False).tolist() == [True, False]
+
+
+def test_import_does_not_load_pandas():
+    code = "import sys, cfobot.data_loader; print('pandas' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("INFORME DE ABRIL APRU- 2025 .xls", "ABRIL"),
+        ("informe de sep apru 2025.xlsx", "SEPTIEMBRE"),
+        ("Balance marzo 2025.xlsx", "MARZO"),
+        ("reporte.xlsx", None),
+    ],
+)
+def test_detect_month_from_filename(name, expected):
+    assert _detect_month_from_filename(Path(name)) == expected
+
+
+def test_financial_data_cached_rebuilds_when_frame_is_replaced():
+    eri = pd.DataFrame({"Codigo": ["5105"]})
+    data = FinancialData(
+        current_month="MARZO",
+        current_month_col="MARZO DE 2025",
+        resultado_current_col="Total MARZO",
+        balance=pd.DataFrame(),
+        eri=eri,
+        resultado=pd.DataFrame(),
+        caratula=pd.DataFrame(),
+        months=["MARZO DE 2025"],
+    )
+    calls = []
+
+    def build(frame):
+        calls.append(frame)
+        return len(frame)
+
+    assert data.cached("rows", data.eri, build) == 1
+    assert data.cached("rows", data.eri, build) == 1
+    data.eri = pd.DataFrame({"Codigo": ["5105", "5305"]})
+    assert data.cached("rows", data.eri, build) == 2
+    assert len(calls) == 2
+
+
+def test_eri_month_values_is_shared_and_read_only():
+    data = FinancialData(
+        current_month="MARZO",
+        current_month_col="MARZO DE 2025",
+        resultado_current_col="Total MARZO",
+        balance=pd.DataFrame(),
+        eri=pd.DataFrame({"Codigo": ["5105", "5305"], "FEBRERO DE 2025": [-10, None], "MARZO DE 2025": [5, 7]}),
+        resultado=pd.DataFrame(),
+        caratula=pd.DataFrame(),
+        months=["FEBRERO DE 2025", "MARZO DE 2025"],
+    )
+
+    values = data.eri_month_values()
+
+    assert values is data.eri_month_values()
+    assert values.dtype == "float64" and not values.flags.writeable
+    assert values[0].tolist() == [-10.0, 5.0]
+    assert pd.isna(values[1, 0])
@@ -0,0 +1,125 @@
+"""Unit tests for ai_analyzer module."""
+
+import json
+
+import pytest
+import pandas as pd
+from unittest.mock import MagicMock, patch
+
+from cfobot.ai_analyzer import FinancialAIAnalyzer
+from cfobot.config import AppConfig
+from cfobot.data_loader import FinancialData
+from cfobot.processing import BudgetResult, BudgetTotals, KPIResult
+
+
+def _make_item(month):
+    data = FinancialData(
+        current_month=month,
+        current_month_col=f'{month} DE 2025',
+        resultado_current_col=f'Total {month}',
+        balance=pd.DataFrame(),
+        eri=pd.DataFrame(),
+        resultado=pd.DataFrame(),
+        caratula=pd.DataFrame(),
+        months=[f'{month} DE 2025'],
+    )
+    budget = BudgetResult(
+        summary=pd.DataFrame(),
+        distribution=pd.DataFrame(),
+        gastos_admin=50000000.0,
+        gastos_otros=5000000.0,
+        costos_venta=30000000.0,
+        costos_produccion=40000000.0,
+        totals=BudgetTotals(120000000.0, 125000000.0, 120.0, 100.0),
+    )
+    kpis = KPIResult(table=pd.DataFrame(), metrics={'Current Ratio': 2.0, 'EBITDA': 20000000.0})
+    return data, budget, kpis
+
+
+def _stream(text, chunk_size=7):
+    for start in range(0, len(text), chunk_size):
+        yield {'message': {'content': text[start:start + chunk_size]}}
+
+
+@pytest.fixture
+def mock_client():
+    """Patch the shared Ollama client factory."""
+    client = MagicMock()
+    with patch('cfobot.ai_analyzer._get_client', return_value=client):
+        yield client
+
+
+class TestAnalyzeFinancials:
+    """Test single-period AI analysis."""
+
+    def test_analyze_financials_stops_at_closing_brace(self, mock_client):
+        """Test that streaming stops once the JSON object is closed."""
+        payload = json.dumps({'executive_summary': 'Resumen {con llaves}', 'key_insights': ['a']})
+        consumed = []
+
+        def stream():
+            for chunk in _stream(payload + '\nTrailing prose that should not be read'):
+                consumed.append(chunk['message']['content'])
+                yield chunk
+
+        mock_client.chat.return_value = stream()
+        analyzer = FinancialAIAnalyzer(AppConfig())
+
+        insights = analyzer.analyze_financials(*_make_item('MARZO'))
+
+        assert insights.executive_summary == 'Resumen {con llaves}'
+        assert insights.key_insights == ['a']
+        assert 'Trailing' not in ''.join(consumed)
+
+    def test_analyze_financials_warns_when_token_limit_truncates_json(self, mock_client, caplog):
+        """Test that a reply cut off by num_predict is logged and falls back to text parsing."""
+        def stream():
+            yield from _stream('{"executive_summary": "Resumen sin cerrar')
+            yield {'message': {'content': ''}, 'done': True, 'done_reason': 'length'}
+
+        mock_client.chat.return_value = stream()
+        analyzer = FinancialAIAnalyzer(AppConfig())
+
+        with caplog.at_level('WARNING', logger='cfobot.ai_analyzer'):
+            insights = analyzer.analyze_financials(*_make_item('MARZO'))
+
+        assert 'token limit' in caplog.text
+        assert mock_client.chat.call_args.kwargs['options']['num_predict'] == AppConfig().ollama.max_tokens
+        assert insights.key_insights[0] == 'Financial analysis completed'
+
+
+class TestAnalyzeFinancialsBatch:
+    """Test batched multi-period AI analysis."""
+
+    def test_analyze_financials_batch_success(self, mock_client):
+        """Test that one call returns insights for every period in order."""
+        payload = json.dumps({'results': [
+            {'executive_summary': 'Enero'},
+            {'executive_summary': 'Febrero'},
+        ]})
+        mock_client.chat.return_value = _stream(payload)
+        analyzer = FinancialAIAnalyzer(AppConfig())
+
+        insights = analyzer.analyze_financials_batch([_make_item('ENERO'), _make_item('FEBRERO')])
+
+        assert [item.executive_summary for item in insights] == ['Enero', 'Febrero']
+        mock_client.chat.assert_called_once()
+        prompt = mock_client.chat.call_args.kwargs['messages'][0]['content']
+        assert 'PERIOD 1:' in prompt and 'PERIOD 2:' in prompt
+
+    def test_analyze_financials_batch_result_count_mismatch(self, mock_client):
+        """Test fallback insights when the model returns the wrong number of results."""
+        mock_client.chat.return_value = _stream(json.dumps({'results': [{'executive_summary': 'Solo uno'}]}))
+        analyzer = FinancialAIAnalyzer(AppConfig())
+
+        insights = analyzer.analyze_financials_batch([_make_item('ENERO'), _make_item('FEBRERO')])
+
+        assert len(insights) == 2
+        assert 'FEBRERO' in insights[1].executive_summary
+
+    def test_analyze_financials_batch_empty(self, mock_client):
+        """Test that an empty batch makes no model call."""
+        analyzer = FinancialAIAnalyzer(AppConfig())
+
+        assert analyzer.analyze_financials_batch([]) == []
+        mock_client.chat.assert_not_called()
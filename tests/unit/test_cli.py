@@ -0,0 +1,24 @@
+"""Unit tests for cli module."""
+
+import pytest
+
+from cfobot.cli import _apply_quantization
+
+
+class TestApplyQuantization:
+    """Test swapping the quantization suffix of an Ollama model tag."""
+
+    def test_apply_quantization_replaces_suffix_of_variant_tag(self):
+        """Test that a tag with a variant keeps it and swaps only the quantization."""
+        assert _apply_quantization("llama3.1:8b-instruct-q4_K_M", "q8_0") == "llama3.1:8b-instruct-q8_0"
+        assert _apply_quantization("llama3.1:8b-text-fp16", "q5_K_M") == "llama3.1:8b-text-q5_K_M"
+
+    def test_apply_quantization_adds_instruct_variant(self):
+        """Test that a size-only tag gets the instruct variant Ollama publishes."""
+        assert _apply_quantization("llama3.1:8b", "q4_K_M") == "llama3.1:8b-instruct-q4_K_M"
+        assert _apply_quantization("mistral:7b-q8_0", "fp16") == "mistral:7b-instruct-fp16"
+
+    def test_apply_quantization_requires_size_tag(self):
+        """Test that an untagged model name is rejected."""
+        with pytest.raises(ValueError, match="model tag"):
+            _apply_quantization("llama3.1", "q4_K_M")
@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-from cfobot.emailer import send_reports
+from cfobot.emailer import SmtpSession, _encode_file_b64, send_reports, send_reports_async
 from cfobot.config import EmailConfig
 
 
@@ -232,3 +232,137 @@ class TestSendReports:
         attachment_parts = [part for part in sent_message.get_payload() 
                            if part.get_content_type() == "application/octet-stream"]
         assert len(attachment_parts) == 2  # Two attachments
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    def test_send_reports_keeps_attachment_order(self, mock_smtp, sample_email_config, tmp_path):
+        """Test that concurrently loaded attachments keep their input order."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+        files = []
+        for index in range(5):
+            file_path = tmp_path / f"report{index}.xlsx"
+            file_path.write_bytes(bytes([index]) * 100)
+            files.append(file_path)
+        files.insert(2, tmp_path / "missing.xlsx")
+
+        send_reports(sample_email_config, "Asunto", "<html>Test Body</html>", files)
+
+        parts = mock_server.send_message.call_args[0][0].get_payload()[1:]
+        assert [part.get_filename() for part in parts] == [f"report{index}.xlsx" for index in range(5)]
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    def test_send_reports_text_attachment_not_base64(self, mock_smtp, sample_email_config, tmp_path):
+        """Test that UTF-8 text reports are attached as 8bit text parts."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+        csv_file = tmp_path / "kpis.csv"
+        csv_file.write_text("Métrica,Valor\nROE %,12.5\n", encoding="utf-8")
+        latin_file = tmp_path / "legacy.csv"
+        latin_file.write_bytes("Año,1\n".encode("latin-1"))
+
+        send_reports(sample_email_config, "Asunto", "<html>Test Body</html>", [csv_file, latin_file])
+
+        parts = mock_server.send_message.call_args[0][0].get_payload()[1:]
+        assert parts[0].get_content_type() == "text/csv"
+        assert parts[0]["Content-Transfer-Encoding"] == "8bit"
+        assert parts[0].get_payload(decode=True).decode("utf-8") == csv_file.read_text(encoding="utf-8")
+        assert parts[1].get_content_type() == "application/octet-stream"
+        assert parts[1]["Content-Transfer-Encoding"] == "base64"
+
+
+class TestSmtpSession:
+    """Test reuse of one SMTP connection across several sends."""
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    def test_session_reuses_connection(self, mock_smtp, sample_email_config, sample_attachments):
+        """Test that several reports go through a single login."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        with SmtpSession(sample_email_config) as session:
+            for subject in ("Primero", "Segundo"):
+                send_reports(session, subject, "<html>Test Body</html>", sample_attachments)
+
+        mock_smtp.assert_called_once_with("smtp.gmail.com", 587, timeout=30)
+        mock_server.login.assert_called_once()
+        assert mock_server.send_message.call_count == 2
+        mock_smtp.return_value.__exit__.assert_called_once()
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    @patch('cfobot.emailer.smtplib.SMTP_SSL')
+    def test_session_uses_implicit_tls_on_port_465(self, mock_smtp_ssl, mock_smtp, sample_email_config):
+        """Test that port 465 connects with SMTP_SSL and skips STARTTLS."""
+        mock_server = MagicMock()
+        mock_smtp_ssl.return_value.__enter__.return_value = mock_server
+        sample_email_config.smtp_port = 465
+
+        with SmtpSession(sample_email_config) as session:
+            send_reports(session, "Asunto", "<html>Test Body</html>", [])
+
+        mock_smtp.assert_not_called()
+        assert mock_smtp_ssl.call_args.args == ("smtp.gmail.com", 465)
+        mock_server.starttls.assert_not_called()
+        mock_server.login.assert_called_once()
+        mock_server.send_message.assert_called_once()
+        mock_smtp_ssl.return_value.__exit__.assert_called_once()
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    def test_session_reconnects_once_after_disconnect(self, mock_smtp, sample_email_config):
+        """Test that a dropped connection is re-opened and the send retried."""
+        from smtplib import SMTPServerDisconnected
+
+        stale_server, fresh_server = MagicMock(), MagicMock()
+        stale_server.send_message.side_effect = SMTPServerDisconnected("closed")
+        stale, fresh = MagicMock(), MagicMock()
+        stale.__enter__.return_value = stale_server
+        fresh.__enter__.return_value = fresh_server
+        mock_smtp.side_effect = [stale, fresh]
+
+        with SmtpSession(sample_email_config) as session:
+            send_reports(session, "Asunto", "<html>Test Body</html>", [])
+
+        assert mock_smtp.call_count == 2
+        fresh_server.send_message.assert_called_once()
+
+
+class TestSendReportsAsync:
+    """Test sending on the background mail worker."""
+
+    @patch('cfobot.emailer.smtplib.SMTP')
+    def test_send_reports_async_sends_in_worker(self, mock_smtp, sample_email_config, sample_attachments):
+        """Test that the future resolves once the message has been sent."""
+        mock_server = MagicMock()
+        mock_smtp.return_value.__enter__.return_value = mock_server
+
+        future = send_reports_async(sample_email_config, "Asunto", "<html>Test Body</html>", sample_attachments)
+
+        assert future.result(timeout=10) is None
+        mock_server.send_message.assert_called_once()
+
+    def test_send_reports_async_reraises_errors(self, sample_email_config):
+        """Test that validation errors surface through the future."""
+        sample_email_config.recipient_emails = []
+
+        future = send_reports_async(sample_email_config, "Asunto", "<html>Test Body</html>", [])
+
+        with pytest.raises(ValueError, match="No recipient emails configured"):
+            future.result(timeout=10)
+
+
+class TestEncodeFileB64:
+    """Test chunked base64 encoding of attachments."""
+
+    @pytest.mark.parametrize("size", [0, 56, 57, 58, 1000])
+    def test_matches_email_encoder(self, tmp_path, size):
+        """Test that the chunked body matches email.encoders output."""
+        from email import encoders
+        from email.mime.base import MIMEBase
+
+        path = tmp_path / "reporte.bin"
+        path.write_bytes(bytes(range(256)) * 4 + b"x" * size)
+        reference = MIMEBase("application", "octet-stream")
+        reference.set_payload(path.read_bytes())
+        encoders.encode_base64(reference)
+
+        assert _encode_file_b64(path, chunk_size=57 * 3) == reference.get_payload()
+        assert _encode_file_b64(path) == reference.get_payload()
@@ -3,20 +3,27 @@
 import pytest
 import pandas as pd
 import numpy as np
-from unittest.mock import Mock
 
 from cfobot.processing import (
     _calculate_income,
     _categorize_expenses,
+    _detail_code_prefixes,
+    _expense_masks,
+    _masked_sums,
+    _percent_change,
+    _resultado_rows,
     _build_budget_summary,
     _build_expense_distribution,
+    _balance_sums,
     _sum_for_balance,
     _get_income_statement_data,
     _calculate_ebitda_components,
     _calculate_financial_ratios,
+    _execution_pct,
     compute_budget_execution,
     compute_kpis,
     BudgetResult,
+    BudgetTotals,
     KPIResult,
 )
 from cfobot.data_loader import FinancialData
@@ -57,9 +64,7 @@ def sample_financial_data():
         'Column_1': [5000000]
     })
     
-    # Mock workbook
-    mock_workbook = Mock()
-    mock_workbook.sheet_names = ['BALANCE MARZO', 'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA']
+    sheet_names = ('BALANCE MARZO', 'INFORME-ERI', 'ESTADO RESULTADO', 'CARATULA')
     
     return FinancialData(
         current_month='MARZO',
@@ -70,7 +75,7 @@ def sample_financial_data():
         resultado=resultado_df,
         caratula=caratula_df,
         months=['ENERO DE 2025', 'FEBRERO DE 2025', 'MARZO DE 2025'],
-        workbook=mock_workbook
+        sheet_names=sheet_names
     )
 
 
@@ -105,7 +110,7 @@ class TestCategorizeExpenses:
     
     def test_categorize_expenses_success(self, sample_financial_data):
         """Test successful expense categorization."""
-        gastos_values, extra_values = _categorize_expenses(sample_financial_data)
+        gastos_values, extra_values, base_masks, extra_masks = _categorize_expenses(sample_financial_data)
         
         # Check base expenses
         assert gastos_values['gastos_admin'] == 50000000.0  # SUELDOS ADMINISTRATIVOS
@@ -117,6 +122,73 @@ class TestCategorizeExpenses:
         assert extra_values['sueldos'] == 50000000.0  # SUELDOS ADMINISTRATIVOS
         assert extra_values['cesantias'] == 10000000.0  # CESANTIAS
 
+        # Masks are returned for reuse
+        assert set(base_masks) == {'gastos_admin', 'gastos_otros', 'costos_venta', 'costos_prod'}
+        assert set(extra_masks) == {'sueldos', 'cesantias'}
+
+
+class TestExpenseMasks:
+    """Test single-pass expense category masks."""
+
+    def test_expense_masks_classify_by_code_prefix(self):
+        """Test that each code lands in exactly one category."""
+        eri = pd.DataFrame({
+            'Codigo': ['510506', '530505', '613505', '720505', '730505', '4135', '51'],
+            'Display Name': ['SUELDOS', 'INTERESES', 'COSTO', 'MO', 'CIF', 'VENTAS', 'GASTOS'],
+        })
+
+        base_masks, extra_masks = _expense_masks(eri)
+
+        assert base_masks['gastos_admin'].tolist() == [True, False, False, False, False, False, False]
+        assert base_masks['gastos_otros'].tolist() == [False, True, False, False, False, False, False]
+        assert base_masks['costos_venta'].tolist() == [False, False, True, False, False, False, False]
+        assert base_masks['costos_prod'].tolist() == [False, False, False, True, True, False, False]
+        assert extra_masks['sueldos'].tolist() == [True, False, False, False, False, False, False]
+        assert not extra_masks['cesantias'].any()
+
+    def test_detail_code_prefixes_match_regex_patterns(self):
+        """Test that the prefix classification agrees with the code patterns."""
+        from cfobot.constants import ADMIN_EXPENSES_PATTERN, PRODUCTION_COSTS_PATTERN
+
+        codes = pd.Series(
+            ['510506', '5105', '51', ' 510506', '51a506', '51٠٥٠٦', '7305059', None, '730505.0', ''],
+            dtype=object,
+        )
+
+        prefixes = _detail_code_prefixes(codes)
+
+        assert (prefixes == 51).tolist() == codes.str.match(ADMIN_EXPENSES_PATTERN, na=False).tolist()
+        assert np.isin(prefixes, (72, 73)).tolist() == codes.str.match(PRODUCTION_COSTS_PATTERN, na=False).tolist()
+        assert _detail_code_prefixes(pd.Series([510506, 4135])).tolist() == [51, -1]
+        assert _detail_code_prefixes(pd.Series([], dtype=object)).tolist() == []
+
+
+class TestMaskedSums:
+    """Test single-pass masked totals."""
+
+    def test_masked_sums_handles_overlap_and_missing_values(self):
+        """Test overlapping masks, NaN amounts and absolute values."""
+        values = pd.Series([-100.0, -50.0, np.nan, 25.0])
+        masks = {
+            'admin': pd.Series([True, True, True, False]),
+            'sueldos': pd.Series([True, False, False, False]),
+            'otros': pd.Series([False, False, False, True]),
+        }
+
+        assert _masked_sums(masks, values) == {'admin': 150.0, 'sueldos': 100.0, 'otros': 25.0}
+        assert _masked_sums({}, values) == {}
+
+
+class TestPercentChange:
+    """Test the safe percentage-change helper."""
+
+    def test_percent_change_zero_and_missing_reference(self):
+        """Test that zero or missing references yield 0 instead of inf/NaN."""
+        current = np.array([110.0, 5.0, 7.0, np.nan])
+        reference = np.array([100.0, 0.0, np.nan, 10.0])
+
+        np.testing.assert_allclose(_percent_change(current, reference), [10.0, 0.0, 0.0, 0.0])
+
 
 class TestBuildBudgetSummary:
     """Test budget summary building function."""
@@ -143,6 +215,16 @@ class TestBuildBudgetSummary:
         assert summary.iloc[0]['% Ejecutado'] == 120.0  # 120M / 100M * 100
 
 
+class TestExecutionPct:
+    """Test budget execution percentage helper."""
+    
+    def test_execution_pct_guards_non_positive_budget(self):
+        """Test that a zero or negative budget yields 0 instead of dividing."""
+        assert _execution_pct(120.0, 100.0) == 120.0
+        assert _execution_pct(50.0, 0.0) == 0
+        assert _execution_pct(10.0, -5.0) == 0
+
+
 class TestSumForBalance:
     """Test balance sheet summation function."""
     
@@ -159,6 +241,14 @@ class TestSumForBalance:
         result = _sum_for_balance(sample_financial_data.balance, "Clase", ["999"])
         assert result == 0.0
 
+    def test_sum_for_balance_with_precomputed_sums(self, sample_financial_data):
+        """Test that a shared groupby gives the same totals as a fresh scan."""
+        balance = sample_financial_data.balance
+        sums = _balance_sums(balance)
+
+        for level, codes in [("Clase", ["1"]), ("Grupo", ["11", "12", "13", "14"]), ("Clase", ["999"])]:
+            assert _sum_for_balance(balance, level, codes, sums) == _sum_for_balance(balance, level, codes)
+
 
 class TestGetIncomeStatementData:
     """Test income statement data extraction."""
@@ -182,6 +272,18 @@ class TestGetIncomeStatementData:
         assert utilidad == 0.0
         assert ingresos == 0.0
 
+    def test_resultado_rows_case_insensitive_and_missing(self):
+        """Test description lookup ignores case and skips non-text cells."""
+        resultado = pd.DataFrame({
+            'Descripcion': ['Ingresos Ordinarios netos', None, 3, 'COSTO DE VENTA', 'ingresos ordinarios'],
+        })
+
+        rows = _resultado_rows(resultado)
+
+        assert rows['ingresos'].tolist() == [0, 4]
+        assert rows['costos'].tolist() == [3]
+        assert rows['utilidad'].tolist() == []
+
 
 class TestCalculateEbitdaComponents:
     """Test EBITDA components calculation."""
@@ -250,6 +352,23 @@ class TestComputeBudgetExecution:
         assert result.costos_venta == 30000000.0
         assert result.costos_produccion == 40000000.0
 
+    def test_compute_budget_execution_totals(self, sample_financial_data, sample_config):
+        """Test that BudgetTotals carries the headline figures of the summary."""
+        sample_financial_data.months = ['MARZO DE 2025']
+
+        result = compute_budget_execution(sample_financial_data, sample_config)
+
+        # Both 5101xx rows are administrative expenses: 60M + 5M + 30M + 40M
+        assert result.totals == BudgetTotals(
+            ingresos_actual=120000000.0,
+            gastos_actual=135000000.0,
+            pct_ingresos=120.0,  # 120M / 100M * 100
+            pct_gastos=108.0,    # 135M / 125M * 100
+        )
+        headline = result.summary.set_index('Categoría')['% Ejecutado']
+        assert headline['Ingresos'] == result.totals.pct_ingresos
+        assert headline['Gastos Totales'] == result.totals.pct_gastos
+
 
 class TestComputeKpis:
     """Test KPI computation."""
@@ -294,7 +413,7 @@ class TestEdgeCases:
             resultado=pd.DataFrame(),
             caratula=pd.DataFrame(),
             months=[],
-            workbook=Mock()
+            sheet_names=()
         )
         
         config = AppConfig()
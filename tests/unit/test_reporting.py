@@ -0,0 +1,23 @@
+"""Unit tests for reporting module."""
+
+import numpy as np
+import pandas as pd
+
+from cfobot.reporting import _write_workbook
+
+
+class TestWriteWorkbook:
+    """Test streamed Excel output."""
+
+    def test_write_workbook_round_trip(self, tmp_path):
+        """Test that every sheet reads back like DataFrame.to_excel output."""
+        summary = pd.DataFrame({"Concepto": ["Ingresos", "Gastos"], "Valor": [100.5, np.nan]})
+        distribution = pd.DataFrame({"Display Name": ["Sueldos"], "Promedio": [12.5]})
+        output_path = tmp_path / "report.xlsx"
+
+        _write_workbook(output_path, {"Ejecutado": summary, "Distribución": distribution})
+
+        sheets = pd.read_excel(output_path, sheet_name=None)
+        assert list(sheets) == ["Ejecutado", "Distribución"]
+        pd.testing.assert_frame_equal(sheets["Ejecutado"], summary)
+        pd.testing.assert_frame_equal(sheets["Distribución"], distribution)
@@ -115,6 +115,16 @@ class TestValidateBalanceEquation:
         df = pd.DataFrame()
         assert validate_balance_equation(df) is False
 
+    def test_validate_categorical_nivel(self):
+        """Test validation when Nivel is stored as a categorical, as loaded."""
+        df = pd.DataFrame({
+            'Nivel': pd.Categorical(['Clase', 'Grupo', 'Clase', 'Clase']),
+            'Código cuenta contable': ['1', '11', '2', '3'],
+            'Saldo final': [1000, 999, 600, 400]
+        })
+        assert validate_balance_equation(df) is True
+        assert validate_balance_equation(df.assign(Nivel=pd.Categorical(['Grupo'] * 4))) is True
+
 
 class TestDetectOutliers:
     """Test outlier detection."""